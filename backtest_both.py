@@ -9,14 +9,17 @@ print('='*70)
 
 results = {}
 
-for symbol in ['TSLA', 'NIO']:
+# Fetch each symbol's series once and share it between the buy-hold
+# benchmark and the strategy run
+bt = Backtester(initial_capital=10000)
+price_data = {symbol: bt.fetch_data(symbol, '2y') for symbol in ['TSLA', 'NIO']}
+
+for symbol, data in price_data.items():
     print(f'\n{"="*70}')
     print(f'  {symbol} BACKTEST')
     print(f'{"="*70}')
 
     # Get buy and hold benchmark
-    bt = Backtester(initial_capital=10000)
-    data = bt.fetch_data(symbol, '2y')
     prices = [d['close'] for d in data]
     start_price = prices[0]
     end_price = prices[-1]
@@ -42,7 +45,8 @@ for symbol in ['TSLA', 'NIO']:
         trailing_stop_pct=None,  # NO TRAILING STOP
         min_hold_days=0,
         rsi_filter=False,
-        volume_filter=False
+        volume_filter=False,
+        data=data  # Reuse the series fetched for the benchmark
     )
 
     results[symbol] = {
@@ -3,12 +3,49 @@ Momentum Stock Screener - Generates ~500 NYSE momentum stocks
 Uses Yahoo Finance for real-time momentum calculation
 """
 
+import logging
+import random
+import time
+
 import yfinance as yf
+import numpy as np
 import pandas as pd
+import requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+logger = logging.getLogger(__name__)
+
+try:
+    from yfinance.exceptions import YFinanceException
+except ImportError:  # older yfinance
+    class YFinanceException(Exception):
+        pass
+
+# tqdm batches progress output onto one carriage-return line instead of
+# pushing full newlines through stdout from the result loop
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+# aiohttp enables the async chart-API fan-out; without it we fall back
+# to batched yf.download in a thread pool
+try:
+    import asyncio
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?range=1y&interval=1d"
+REQUEST_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+# Daily on-disk cache - a second screen on the same day is a pure local read
+CACHE_DIR = Path.home() / ".cache" / "momentum"
+
 # Large-cap and mid-cap NYSE stocks (high liquidity candidates)
 NYSE_STOCKS = [
     # S&P 500 + Russell 1000 NYSE-listed stocks
@@ -82,76 +119,298 @@ NYSE_STOCKS = [
     "ARCT", "IBIO", "CODX", "QDEL", "DGX", "LH", "PKI", "A", "TMO", "DHR"
 ]
 
-# Remove duplicates and clean
-NYSE_STOCKS = list(set([s.upper() for s in NYSE_STOCKS if s]))
+# Remove duplicates while preserving curated order; tuple freezes the result
+NYSE_STOCKS = tuple(dict.fromkeys(s.upper() for s in NYSE_STOCKS if s))
 
-def calculate_momentum(symbol):
-    """Calculate 12-month momentum (excluding last month) for a stock"""
-    try:
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period="1y")
+# Symbols per yf.download batch - one HTTP request covers the whole chunk
+CHUNK_SIZE = 50
 
-        if len(hist) < 200:  # Need enough data
+def calculate_momentum(symbol, hist):
+    """Calculate 12-month momentum (excluding last month) from a price history"""
+    try:
+        if hist is None or len(hist) < 200:  # Need enough data
             return None
 
+        # Grab the raw ndarrays once - NumPy scalar indexing skips the
+        # pandas .iloc dispatch overhead (matters across 600 symbols).
+        # float32/int32 halve the bytes moved; ample precision for
+        # 2-decimal prices and integer volumes
+        closes = hist['Close'].to_numpy(dtype=np.float32)
+        volumes = hist['Volume'].to_numpy(dtype=np.int32)
+
         # 12-month return excluding last month (standard momentum factor)
-        price_12m_ago = hist['Close'].iloc[0]
-        price_1m_ago = hist['Close'].iloc[-22] if len(hist) > 22 else hist['Close'].iloc[0]
-        current_price = hist['Close'].iloc[-1]
+        price_12m_ago = closes[0]
+        price_1m_ago = closes[-22] if len(closes) > 22 else closes[0]
+        current_price = closes[-1]
 
         # Momentum = 12-month return - 1-month return (reversal adjustment)
         momentum_12m = (price_1m_ago - price_12m_ago) / price_12m_ago * 100
 
         # Also get some basic info
-        avg_volume = hist['Volume'].mean()
-
-        return {
-            'symbol': symbol,
-            'momentum_12m': round(momentum_12m, 2),
-            'current_price': round(current_price, 2),
-            'avg_volume': int(avg_volume)
-        }
-    except Exception as e:
+        avg_volume = volumes.mean()
+
+        # Plain tuple matching the result-array field order - cheaper than
+        # a dict per symbol and slots straight into the structured array
+        return (symbol, round(float(momentum_12m), 2),
+                round(float(current_price), 2), int(avg_volume))
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        # Malformed history for this symbol - log it instead of hiding it,
+        # and don't swallow unrelated bugs with a bare except
+        logger.warning(f"Momentum calc failed for {symbol}: {e}")
+        return None
+
+def load_cached_history(cache_dir, symbol):
+    """Load a symbol's cached history for today, or None on miss"""
+    path = cache_dir / f"{symbol}.parquet"
+    if not path.exists():
+        return None
+    try:
+        return pd.read_parquet(path, columns=['Close', 'Volume'])
+    except Exception:
         return None
 
+def fetch_histories_async(symbols):
+    """Fetch 1y daily history for many symbols concurrently via the chart API
+
+    Parses the Yahoo chart JSON directly into Close/Volume frames, skipping
+    yfinance's wrapping overhead. A semaphore caps in-flight requests.
+    """
+    semaphore = asyncio.Semaphore(64)
+
+    async def fetch_one(session, symbol):
+        payload = None
+        for attempt in range(3):
+            async with semaphore:
+                try:
+                    async with session.get(CHART_URL.format(symbol=symbol),
+                                           headers=REQUEST_HEADERS) as resp:
+                        if resp.status == 429:
+                            raise aiohttp.ClientResponseError(
+                                resp.request_info, resp.history,
+                                status=429, message='rate limited')
+                        payload = await resp.json()
+                        break
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.warning(f"Chart fetch failed for {symbol}: {e} "
+                                   f"(attempt {attempt + 1}/3)")
+            # Backoff outside the semaphore so retries don't hold a slot
+            if attempt < 2:
+                await asyncio.sleep(2 ** attempt + random.random())
+        if payload is None:
+            return symbol, None
+        try:
+            quote = payload['chart']['result'][0]['indicators']['quote'][0]
+            hist = pd.DataFrame({
+                'Close': np.asarray(quote['close'], dtype=np.float32),
+                'Volume': np.asarray(quote['volume'], dtype=np.float32)
+            }).dropna()
+            return symbol, hist
+        except (KeyError, IndexError, TypeError):
+            return symbol, None
+
+    async def fetch_all():
+        async with aiohttp.ClientSession() as session:
+            return await asyncio.gather(*(fetch_one(session, s) for s in symbols))
+
+    return asyncio.run(fetch_all())
+
+def screen_async(symbols):
+    """Screen symbols using the async fan-out, with the daily cache in front"""
+    cache_dir = CACHE_DIR / pd.Timestamp.now().strftime('%Y%m%d')
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    misses = []
+    for symbol in symbols:
+        hist = load_cached_history(cache_dir, symbol)
+        if hist is not None:
+            result = calculate_momentum(symbol, hist)
+            if result:
+                results.append(result)
+        else:
+            misses.append(symbol)
+
+    if misses:
+        for symbol, hist in fetch_histories_async(misses):
+            if hist is None:
+                continue
+            try:
+                hist.to_parquet(cache_dir / f"{symbol}.parquet")
+            except Exception:
+                pass  # Cache write failure shouldn't break the screen
+            result = calculate_momentum(symbol, hist)
+            if result:
+                results.append(result)
+    return results
+
+def fetch_chunk(chunk):
+    """Download 1y of history for a chunk of symbols in a single batched request
+
+    Histories are cached per-symbol under ~/.cache/momentum/{YYYYMMDD}/ so
+    repeat screens within the same trading day skip the network entirely.
+    """
+    cache_dir = CACHE_DIR / pd.Timestamp.now().strftime('%Y%m%d')
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    misses = []
+    for symbol in chunk:
+        hist = load_cached_history(cache_dir, symbol)
+        if hist is not None:
+            result = calculate_momentum(symbol, hist)
+            if result:
+                results.append(result)
+        else:
+            misses.append(symbol)
+
+    if not misses:
+        return results
+
+    data = None
+    for attempt in range(3):
+        try:
+            data = yf.download(
+                tickers=" ".join(misses),
+                period="1y",
+                group_by='ticker',
+                auto_adjust=False,
+                threads=True,
+                progress=False
+            )
+            break
+        except (requests.RequestException, YFinanceException) as e:
+            # Transient network errors and 429 rate limits are retry-worthy:
+            # capped exponential backoff instead of a permanent miss
+            logger.warning(f"Chunk download failed ({misses[0]}...): {e} "
+                           f"(attempt {attempt + 1}/3)")
+            if attempt < 2:
+                time.sleep(2 ** attempt + random.random())
+
+    if data is None:
+        return results
+
+    results.extend(score_chunk_matrix(data, misses, cache_dir))
+    return results
+
+def score_chunk_matrix(data, symbols, cache_dir):
+    """Score a batched download via a Fortran-order close matrix
+
+    The download shares one date index, so each symbol's Close/Volume
+    series packs into a column of an F-order (n_days, n_syms) matrix -
+    one contiguous stripe per symbol, which is what the per-symbol
+    reductions stream over. The momentum factor then becomes a single
+    vector op across the whole chunk. Symbols with gaps in their
+    history fall back to the per-symbol path.
+    """
+    clean = []
+    ragged = []
+    for symbol in symbols:
+        try:
+            sub = data[symbol] if len(symbols) > 1 else data
+        except KeyError:
+            continue
+        try:
+            sub[['Close', 'Volume']].dropna().to_parquet(cache_dir / f"{symbol}.parquet")
+        except Exception:
+            pass  # Cache write failure shouldn't break the screen
+        closes = sub['Close'].to_numpy(dtype=np.float32)
+        vols = sub['Volume'].to_numpy(dtype=np.float32)
+        if np.isnan(closes).any() or np.isnan(vols).any():
+            ragged.append((symbol, sub.dropna()))
+        else:
+            clean.append((symbol, closes, vols))
+
+    results = []
+    if clean and len(clean[0][1]) >= 200:
+        n_days = len(clean[0][1])
+        close_mat = np.empty((n_days, len(clean)), dtype=np.float32, order='F')
+        vol_mat = np.empty((n_days, len(clean)), dtype=np.float32, order='F')
+        for j, (_, closes, vols) in enumerate(clean):
+            close_mat[:, j] = closes
+            vol_mat[:, j] = vols
+
+        # Same arithmetic as calculate_momentum, across all columns at once
+        mom = (close_mat[-22] - close_mat[0]) / close_mat[0] * 100
+        current = close_mat[-1]
+        avg_vol = vol_mat.mean(axis=0)
+        for j, (symbol, _, _) in enumerate(clean):
+            results.append((symbol, round(float(mom[j]), 2),
+                            round(float(current[j]), 2), int(avg_vol[j])))
+    else:
+        # Too little shared history for the matrix path - score one by one
+        ragged.extend((symbol, pd.DataFrame({'Close': c, 'Volume': v}))
+                      for symbol, c, v in clean)
+
+    for symbol, hist in ragged:
+        result = calculate_momentum(symbol, hist)
+        if result:
+            results.append(result)
+    return results
+
 def get_momentum_stocks(min_stocks=500, min_volume=500000):
     """Get top momentum stocks from NYSE"""
     print(f"Screening {len(NYSE_STOCKS)} stocks for momentum...")
 
-    results = []
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = {executor.submit(calculate_momentum, symbol): symbol for symbol in NYSE_STOCKS}
+    if HAS_AIOHTTP:
+        # Async fan-out: hundreds of chart-API requests in flight at once,
+        # far cheaper than blocking threads for pure network I/O
+        results = [r for r in screen_async(NYSE_STOCKS)
+                   if r[3] >= min_volume]
+    else:
+        # Fallback: batch symbols into chunks of ~50 so the whole screen is
+        # a handful of HTTP requests instead of one round-trip per symbol
+        chunks = [NYSE_STOCKS[i:i + CHUNK_SIZE] for i in range(0, len(NYSE_STOCKS), CHUNK_SIZE)]
 
-        for i, future in enumerate(as_completed(futures)):
-            result = future.result()
-            if result and result['avg_volume'] >= min_volume:
-                results.append(result)
+        results = []
+        processed = 0
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            futures = {executor.submit(fetch_chunk, chunk): chunk for chunk in chunks}
 
-            if (i + 1) % 50 == 0:
-                print(f"Processed {i + 1}/{len(NYSE_STOCKS)} stocks...")
+            completed = tqdm(as_completed(futures), total=len(futures),
+                             unit='chunk') if tqdm else as_completed(futures)
+            for future in completed:
+                chunk_results = future.result()
+                results.extend(r for r in chunk_results if r[3] >= min_volume)
 
-    # Sort by momentum (highest first)
-    df = pd.DataFrame(results)
-    df = df.sort_values('momentum_12m', ascending=False)
+                if not tqdm:
+                    processed += len(futures[future])
+                    print(f"Processed {processed}/{len(NYSE_STOCKS)} stocks...")
 
-    # Take top stocks
-    df = df.head(min_stocks)
+    # Aggregate into a structured array - much cheaper to build and sort
+    # than a DataFrame from a list of dicts
+    out = np.empty(len(results), dtype=[
+        ('symbol', 'U8'), ('momentum_12m', 'f4'),
+        ('current_price', 'f4'), ('avg_volume', 'i8')
+    ])
+    for i, r in enumerate(results):
+        out[i] = r  # (symbol, momentum_12m, current_price, avg_volume)
 
-    return df
+    # Select the top stocks with an O(N) partition, then sort just those
+    # by momentum (highest first) - cheaper than sorting the whole universe
+    mom = out['momentum_12m']
+    k = min(min_stocks, len(mom))
+    top_idx = np.argpartition(-mom, k - 1)[:k] if k < len(mom) else np.arange(len(mom))
+    top = out[top_idx[np.argsort(-mom[top_idx])]]
+
+    # Convert to DataFrame only at the end via the fast columnar constructor
+    # (for saving and pretty-printing)
+    return pd.DataFrame({name: top[name] for name in top.dtype.names})
 
 def save_momentum_list(df, filename="momentum_stocks_list.txt"):
     """Save momentum stocks to a simple list file"""
-    with open(filename, 'w') as f:
-        f.write("# NYSE Momentum Stocks\n")
-        f.write(f"# Generated: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M')}\n")
-        f.write(f"# Total: {len(df)} stocks\n")
-        f.write("# Format: SYMBOL, 12M_MOMENTUM%, PRICE, AVG_VOLUME\n\n")
-
-        for _, row in df.iterrows():
-            f.write(f"{row['symbol']}\n")
+    # Build both files in memory and write each with a single call
+    header = (
+        "# NYSE Momentum Stocks\n"
+        f"# Generated: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M')}\n"
+        f"# Total: {len(df)} stocks\n"
+        "# Format: SYMBOL, 12M_MOMENTUM%, PRICE, AVG_VOLUME\n\n"
+    )
+    # Bulk write - iterrows would rebox every cell into Python scalars
+    symbols = "\n".join(df['symbol'].to_numpy().tolist()) + "\n"
+    Path(filename).write_text(header + symbols)
 
-    # Also save detailed CSV
-    df.to_csv(filename.replace('.txt', '.csv'), index=False)
+    # Also save detailed CSV (rendered in memory, one write)
+    Path(filename.replace('.txt', '.csv')).write_text(df.to_csv(index=False))
     print(f"Saved {len(df)} stocks to {filename}")
 
 if __name__ == "__main__":
@@ -133,9 +133,8 @@ MOMENTUM_STOCKS = [
     "NUE", "STLD", "X", "CLF", "AA", "ATI", "CENX", "KALU", "CMC", "RS"
 ]
 
-# Deduplicate while preserving order
-seen = set()
-MOMENTUM_STOCKS = [x for x in MOMENTUM_STOCKS if not (x in seen or seen.add(x))]
+# Deduplicate while preserving order; tuple freezes the result
+MOMENTUM_STOCKS = tuple(dict.fromkeys(MOMENTUM_STOCKS))
 
 print(f"Total momentum stocks: {len(MOMENTUM_STOCKS)}")
 
@@ -6,13 +6,17 @@ Supports categorized stock universe for organized trading.
 import os
 import sys
 import csv
+import asyncio
 import json
 import time
+import queue
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import threading
 import subprocess
 import multiprocessing
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -33,6 +37,8 @@ from src.activity_logger import activity_logger
 from src.tick_scalper import tick_scalper
 from src.market_state import market_engine
 from src.selective_rsi_strategy import SelectiveRSIStrategy, SelectiveRSIConfig
+import numpy as np
+from src.fast_ma import crossover_strength, batch_strengths, warmup as fast_ma_warmup
 
 # Import stock universe for category support
 try:
@@ -50,20 +56,36 @@ except ImportError:
     UNIVERSE_AVAILABLE = False
     SYMBOL_POSITION_OVERRIDES = {}
 
+# orjson serializes the dashboard state via a C path - optional, stdlib
+# json is used when it is not installed
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Position value limits in USD
 MIN_POSITION_VALUE_USD = float(os.getenv('MIN_POSITION_VALUE_USD', '900'))
 MAX_POSITION_VALUE_USD = float(os.getenv('MAX_POSITION_VALUE_USD', '1500'))
 MAX_SPREAD_PCT = float(os.getenv('MAX_SPREAD_PCT', '0.15'))  # Max bid-ask spread %
 
-# Setup logging
+# Setup logging - handlers run behind a queue so the trading loop never
+# blocks on disk or console writes
+_log_queue = queue.Queue(-1)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/multi_bot.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('logs/multi_bot.log'),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 
@@ -178,17 +200,67 @@ class StockTrader:
         # Events and news
         self.upcoming_events = {}
         self.news = []
-        self.last_info_update = 0
+        # Backdated by their interval so the first check is already due
+        # (these are compared against time.monotonic(), where 0 means
+        # "at boot", not "long ago")
+        self.last_info_update = time.monotonic() - 3600
         # 24H intraday prices for sparkline
         self.intraday_prices = []
-        self.last_intraday_update = 0
+        self.last_intraday_update = time.monotonic() - 600
         # Beta vs MSCI World (URTH)
         self.beta = None
         # Analyst ratings (Buy/Hold/Sell)
         self.analyst_ratings = None
+        # get_state memoization - dashboard polls far faster than prices arrive
+        self._state_key = None
+        self._state_cache = None
+        # Preconstructed order templates - place_order mutates two fields
+        # instead of re-initializing an ib_insync Order each time
+        self._buy_tmpl = LimitOrder('BUY', 0, 0.0)
+        self._sell_tmpl = LimitOrder('SELL', 0, 0.0)
+        self._buy_trade = None
+        self._sell_trade = None
+
+    def take_order_template(self, action: str, quantity: float, limit_price: float):
+        """Return a LimitOrder for placement, reusing the cached template.
+
+        A template attached to a still-live trade must not be mutated -
+        placeOrder would treat it as an order modification - so fall back
+        to a fresh object in that (rare) case.
+        """
+        if action == 'BUY':
+            tmpl, prev = self._buy_tmpl, self._buy_trade
+        else:
+            tmpl, prev = self._sell_tmpl, self._sell_trade
+        if prev is not None and not prev.isDone():
+            return LimitOrder(action, quantity, limit_price)
+        tmpl.orderId = 0  # New order - let IB assign a fresh id
+        tmpl.permId = 0
+        tmpl.totalQuantity = quantity
+        tmpl.lmtPrice = limit_price
+        return tmpl
+
+    def note_order_placed(self, order, ib_trade):
+        """Remember which trade owns each template (see take_order_template)"""
+        if order is self._buy_tmpl:
+            self._buy_trade = ib_trade
+        elif order is self._sell_tmpl:
+            self._sell_trade = ib_trade
+
+    def get_state(self, lightweight: bool = False, regime: str = "UNKNOWN",
+                  ma_hint: tuple = None) -> dict:
+        """Get current state for dashboard. Use lightweight=True for WebSocket updates.
+
+        ma_hint optionally carries (short_ma, long_ma, strength) precomputed
+        by the batched kernel in update_dashboard.
+        """
+        # Nothing in the state changes between price ticks, so reuse the
+        # previous dict unless price/position/mode moved since last call
+        key = (self.last_price, len(self.strategy.prices), self.position,
+               self.strategy.in_position, lightweight, regime)
+        if key == self._state_key and self._state_cache is not None:
+            return self._state_cache
 
-    def get_state(self, lightweight: bool = False, regime: str = "UNKNOWN") -> dict:
-        """Get current state for dashboard. Use lightweight=True for WebSocket updates."""
         short_ma = 0
         long_ma = 0
         signal = "WAIT"
@@ -213,13 +285,17 @@ class StockTrader:
             if hasattr(self.strategy, 'get_current_rsi'):
                 rsi = self.strategy.get_current_rsi()
         elif self.strategy_type == "MA_CROSSOVER":
-            # MA Crossover strategy
-            if len(self.strategy.prices) >= self.strategy.short_window:
-                short_ma = sum(list(self.strategy.prices)[-self.strategy.short_window:]) / self.strategy.short_window
-            if len(self.strategy.prices) >= self.strategy.long_window:
-                long_ma = sum(list(self.strategy.prices)[-self.strategy.long_window:]) / self.strategy.long_window
+            # MA Crossover strategy - O(1) reads of the rolling sums,
+            # or values from the batched kernel when provided
+            if ma_hint is not None:
+                short_ma, long_ma, signal_strength = ma_hint
+            else:
+                short_ma = self.strategy.get_short_ma()
+                long_ma = self.strategy.get_long_ma()
+            if long_ma:
                 signal = self.strategy.get_signal()
-                signal_strength, _ = self._calculate_probability(short_ma, long_ma)
+                if ma_hint is None:
+                    signal_strength, _ = self._calculate_probability(short_ma, long_ma)
             rsi = self.strategy.get_current_rsi()
 
         # Determine filter status and stop-out state
@@ -298,6 +374,8 @@ class StockTrader:
             state['price_history'] = self.intraday_prices[-50:] if self.intraday_prices else []
             state['tick_prices'] = list(self.strategy.prices)[-60:] if self.strategy.prices else []
 
+        self._state_key = key
+        self._state_cache = state
         return state
 
     def _calculate_probability(self, short_ma: float, long_ma: float) -> tuple:
@@ -307,35 +385,8 @@ class StockTrader:
 
         Scale: -100 (SELL signal) to +100 (BUY signal)
         """
-        if long_ma == 0:
-            return (0, 0)
-
-        threshold = self.threshold  # Use configured threshold (0.3%)
-
-        # Calculate the thresholds
-        buy_threshold = long_ma * (1 + threshold)
-        sell_threshold = long_ma * (1 - threshold)
-
-        # Range between thresholds
-        threshold_range = buy_threshold - sell_threshold
-
-        if threshold_range == 0:
-            return (0, 0)
-
-        # Where is short_ma relative to the thresholds?
-        if short_ma >= buy_threshold:
-            # Above buy threshold = BUY signal active
-            signal = 100
-        elif short_ma <= sell_threshold:
-            # Below sell threshold = SELL signal active
-            signal = -100
-        else:
-            # Between thresholds: scale linearly
-            # sell_threshold = -100, long_ma = 0, buy_threshold = +100
-            position = (short_ma - sell_threshold) / threshold_range
-            signal = (position * 200) - 100  # Scale 0-1 to -100 to +100
-
-        return (round(signal, 1), 0)
+        # Numeric core lives in src/fast_ma.py (JIT-compiled with Numba)
+        return (round(crossover_strength(short_ma, long_ma, self.threshold), 1), 0)
 
     def _get_news_sentiment(self) -> float:
         """Calculate average sentiment score from news (-100 to +100)"""
@@ -388,7 +439,7 @@ class MultiStockBot:
         # Cash balance caching (updated every 60s)
         self.available_cash_usd = 0
         self.net_liquidation_usd = 0
-        self.last_balance_check = 0
+        self.last_balance_check = time.monotonic() - 60  # first check is due
         self.usd_dkk_rate = 6.9  # Approximate USD to DKK rate
 
         # Circuit breakers (safety limits)
@@ -411,10 +462,12 @@ class MultiStockBot:
             if 'ALL' in categories:
                 self.symbols = get_all_symbols()
             else:
+                seen = set()  # Set-backed dedup - list membership is O(N)
                 for cat in categories:
                     cat_symbols = get_symbols_by_category(cat)
                     for sym in cat_symbols:
-                        if sym not in self.symbols:
+                        if sym not in seen:
+                            seen.add(sym)
                             self.symbols.append(sym)
                             self.symbol_categories[sym] = cat
             logger.info(f"Loaded {len(self.symbols)} symbols from categories: {categories}")
@@ -500,11 +553,12 @@ class MultiStockBot:
         self.tick_writers = {}  # symbol -> csv.writer
         self.tick_files = {}   # symbol -> file handle
         self.tick_counts = {}  # symbol -> count
-        self.last_tick_flush = 0
+        self.last_tick_flush = time.monotonic() - 60  # first flush is due
 
         # IBKR streaming market data
         self.tickers = {}  # symbol -> Ticker object
         self.regime_ticker = None  # Ticker for regime index (SPY)
+        self._pos_by_symbol = {}  # symbol -> position, refreshed by positionEvent
 
         # Order tracking for timeout cancellation
         self.pending_orders = {}  # order_id -> {'symbol': str, 'time': float, 'trade': Trade}
@@ -534,6 +588,11 @@ class MultiStockBot:
         # YFinance client for events and supplementary data
         self.yfinance_client = YFinanceClient()
 
+        # Thread pool for events/news fetches (I/O-bound, keeps the main
+        # price/trade loop from blocking on HTTP)
+        self._info_pool = ThreadPoolExecutor(max_workers=min(16, 2 * max(1, len(self.symbols))))
+        self._info_future = None
+
         # Set up market state engine with regime detector
         if self.regime_detector:
             market_engine.set_regime_detector(self.regime_detector)
@@ -571,11 +630,23 @@ class MultiStockBot:
             )
             logger.info(f"Created trader for {symbol} [{category}] (size: {pos_size})")
 
-        self.last_price_time = 0
-        self.last_trade_time = 0
-        self.last_info_time = 0
+        # Traders never change after init - cache the iteration tuples so
+        # the per-tick loops skip rebuilding dict views
+        self._trader_items = tuple(self.traders.items())
+        self._trader_list = tuple(self.traders.values())
+
         self._market_open_cache = None
         self._market_open_cache_time = 0
+        self._last_ts_sec = 0
+        self._last_ts_iso = None
+        self._last_state_hash = None
+        self._last_state_write = 0
+
+        # Prime price buffers from the last session so a quick restart
+        # does not sit through the full warm-up collection again
+        self._last_price_state_save = 0
+        self._restored_symbols = set()
+        self._restore_price_state()
 
         mode = "DRY RUN" if self.dry_run else "LIVE TRADING"
         logger.info(f"Multi-Stock Bot initialized - Symbols: {self.symbols}, Mode: {mode}")
@@ -609,8 +680,17 @@ class MultiStockBot:
                 if bars and len(bars) >= self.long_ma:
                     # Add closing prices to strategy (take last long_ma * 2 for buffer)
                     prices_to_load = bars[-(self.long_ma * 2):]
-                    for bar in prices_to_load:
-                        trader.strategy.add_price(bar.close)
+                    restored = symbol in self._restored_symbols
+                    if restored:
+                        # Buffer was restored with tick-interval prices from
+                        # the last session - stacking daily closes on top
+                        # would let the restored realtime_ticks count pass
+                        # the warm-up gate on MAs dominated by stale daily
+                        # bars, which is exactly what that gate prevents
+                        logger.info(f"{symbol}: Keeping restored tick buffer (skipping daily-bar preload)")
+                    else:
+                        for bar in prices_to_load:
+                            trader.strategy.add_price(bar.close)
 
                     # Also load into SelectiveRSI strategy (uses add_historical_bar for direct loading)
                     if self.selective_rsi:
@@ -619,11 +699,14 @@ class MultiStockBot:
                                 symbol, bar.close, bar.high, bar.low, bar.volume
                             )
 
-                    # Set last price from most recent bar
-                    trader.last_price = bars[-1].close
+                    # Set last price from most recent bar (unless a fresher
+                    # restored tick price is already in place)
+                    if not restored:
+                        trader.last_price = bars[-1].close
                     trader.previous_close = bars[-2].close if len(bars) > 1 else bars[-1].close
 
-                    logger.info(f"{symbol}: Loaded {len(prices_to_load)} historical prices from IBKR (latest: ${trader.last_price:.2f})")
+                    if not restored:
+                        logger.info(f"{symbol}: Loaded {len(prices_to_load)} historical prices from IBKR (latest: ${trader.last_price:.2f})")
                 else:
                     logger.warning(f"{symbol}: Insufficient historical data ({len(bars) if bars else 0} bars)")
 
@@ -742,7 +825,7 @@ class MultiStockBot:
         self.tick_files = {}
         self.tick_writers = {}
 
-    def cancel_stale_orders(self):
+    async def cancel_stale_orders(self):
         """Cancel any open orders from previous sessions to start fresh"""
         try:
             open_orders = self.ib.openOrders()
@@ -767,7 +850,7 @@ class MultiStockBot:
 
             if cancelled_count > 0:
                 logger.info(f"[STARTUP] Cancelled {cancelled_count} stale orders")
-                self.ib.sleep(1)  # Allow cancellations to process
+                await asyncio.sleep(1)  # Allow cancellations to process
 
         except Exception as e:
             logger.error(f"Error checking for stale orders: {e}")
@@ -777,7 +860,7 @@ class MultiStockBot:
         if not self.pending_orders:
             return
 
-        current_time = time.time()
+        current_time = time.monotonic()
         orders_to_remove = []
 
         for order_id, order_info in self.pending_orders.items():
@@ -826,26 +909,29 @@ class MultiStockBot:
         for order_id in orders_to_remove:
             del self.pending_orders[order_id]
 
-    def connect(self):
-        """Connect to Interactive Brokers and subscribe to market data"""
+    async def connect_async(self):
+        """Connect to IB and subscribe to market data; safe to call from
+        tasks on the live event loop (e.g. the health-check reconnect)"""
         try:
             # Initialize ProcessPoolExecutor for multi-core signal processing
-            if self.use_multiprocessing and self.tick_mode:
+            if self.use_multiprocessing and self.tick_mode and not self.process_pool:
                 self.process_pool = ProcessPoolExecutor(max_workers=self.parallel_workers)
                 logger.info(f"MULTI-CORE ENABLED: ProcessPoolExecutor with {self.parallel_workers} workers")
 
-            self.ib.connect(self.host, self.port, clientId=self.client_id)
+            await self.ib.connectAsync(self.host, self.port, clientId=self.client_id)
             logger.info(f"Connected to IB Gateway at {self.host}:{self.port}")
 
             # Initialize trade verifier with IB connection
             trade_verifier.set_ib(self.ib)
 
-            # Qualify contracts and subscribe to streaming market data
-            for symbol, trader in self.traders.items():
-                self.ib.qualifyContracts(trader.contract)
-                logger.info(f"Contract qualified: {trader.contract}")
+            # Qualify all contracts in one variadic call - ib_insync issues
+            # the contract-detail requests concurrently, so startup costs
+            # one round trip instead of one per symbol
+            await self.ib.qualifyContractsAsync(*(t.contract for _, t in self._trader_items))
+            logger.info(f"Qualified {len(self.traders)} contracts")
 
-                # Subscribe to streaming market data
+            # Subscribe to streaming market data
+            for symbol, trader in self._trader_items:
                 ticker = self.ib.reqMktData(trader.contract, '', False, False)
                 self.tickers[symbol] = ticker
                 trader.ticker = ticker
@@ -854,7 +940,7 @@ class MultiStockBot:
             # Subscribe to regime index if enabled
             if self.regime_detector:
                 regime_contract = Stock(self.regime_index, 'SMART', 'USD')
-                self.ib.qualifyContracts(regime_contract)
+                await self.ib.qualifyContractsAsync(regime_contract)
                 self.regime_ticker = self.ib.reqMktData(regime_contract, '', False, False)
                 logger.info(f"Subscribed to regime index: {self.regime_index}")
 
@@ -863,12 +949,17 @@ class MultiStockBot:
                 self.ib.pendingTickersEvent += self.on_pending_tickers
                 logger.info("TICK MODE ENABLED: Processing every tick in real-time")
 
+            # Seed the position cache and keep it current via events,
+            # so get_position never re-scans ib.positions() per symbol
+            self._pos_by_symbol = {p.contract.symbol: p.position for p in self.ib.positions()}
+            self.ib.positionEvent += self._on_position
+
             # Allow time for initial data to arrive
-            self.ib.sleep(2)
+            await asyncio.sleep(2)
             logger.info("IBKR streaming market data initialized")
 
             # Cancel any stale orders from previous sessions
-            self.cancel_stale_orders()
+            await self.cancel_stale_orders()
 
             # Initialize tick data collection if enabled
             self.init_tick_collection()
@@ -878,6 +969,10 @@ class MultiStockBot:
             logger.error(f"Failed to connect to IB: {e}")
             return False
 
+    def connect(self):
+        """Blocking connect for startup, before the event loop runs"""
+        return self.ib.run(self.connect_async())
+
     def disconnect(self):
         """Disconnect from IB and cancel market data subscriptions"""
         # Shutdown process pool if running
@@ -885,6 +980,9 @@ class MultiStockBot:
             self.process_pool.shutdown(wait=False)
             logger.info("ProcessPoolExecutor shutdown")
 
+        # Stop background info fetches
+        self._info_pool.shutdown(wait=False)
+
         # Close tick data files if collecting
         self.close_tick_files()
 
@@ -929,7 +1027,7 @@ class MultiStockBot:
     def is_market_open(self) -> bool:
         """Check if US stock market is currently open (cached for 30 seconds)"""
         import time as _time
-        current_time = _time.time()
+        current_time = _time.monotonic()
 
         # Return cached value if less than 30 seconds old
         if self._market_open_cache is not None and (current_time - self._market_open_cache_time) < 30:
@@ -963,18 +1061,26 @@ class MultiStockBot:
             logger.warning(f"No ticker for {trader.symbol}")
             return trader.last_price if trader.last_price > 0 else None
 
+        # Hoist the streaming fields to locals once - this runs per symbol
+        # per tick, and each ticker.<attr> is an attribute walk
+        last = ticker.last
+        bid = ticker.bid
+        ask = ticker.ask
+        close = ticker.close
+        isNan = util.isNan
+
         # Get the best available price from streaming data
         price = None
 
         # Prefer last traded price
-        if ticker.last and not util.isNan(ticker.last) and ticker.last > 0:
-            price = ticker.last
+        if last and not isNan(last) and last > 0:
+            price = last
         # Fall back to mid price
-        elif ticker.bid and ticker.ask and not util.isNan(ticker.bid) and not util.isNan(ticker.ask) and ticker.bid > 0:
-            price = (ticker.bid + ticker.ask) / 2
+        elif bid and ask and not isNan(bid) and not isNan(ask) and bid > 0:
+            price = (bid + ask) / 2
         # Fall back to close price from ticker
-        elif ticker.close and not util.isNan(ticker.close) and ticker.close > 0:
-            price = ticker.close
+        elif close and not isNan(close) and close > 0:
+            price = close
         # Fall back to last known price (from historical preload)
         elif trader.last_price > 0:
             price = trader.last_price
@@ -983,9 +1089,9 @@ class MultiStockBot:
 
         if price and price > 0:
             trader.last_price = price
-            trader.last_bid = ticker.bid if ticker.bid and not util.isNan(ticker.bid) and ticker.bid > 0 else price
-            trader.last_ask = ticker.ask if ticker.ask and not util.isNan(ticker.ask) and ticker.ask > 0 else price
-            trader.previous_close = ticker.close if ticker.close and not util.isNan(ticker.close) and ticker.close > 0 else trader.previous_close
+            trader.last_bid = bid if bid and not isNan(bid) and bid > 0 else price
+            trader.last_ask = ask if ask and not isNan(ask) and ask > 0 else price
+            trader.previous_close = close if close and not isNan(close) and close > 0 else trader.previous_close
             trader.data_source = 'IBKR'
             return price
 
@@ -996,13 +1102,74 @@ class MultiStockBot:
 
         return None
 
+    def _price_state_file(self) -> str:
+        return os.path.join(os.path.dirname(__file__), 'data', 'price_state.json')
+
+    def _save_price_state(self):
+        """Snapshot every trader's price buffer so a restart can skip warm-up"""
+        try:
+            state = {}
+            for symbol, trader in self._trader_items:
+                prices = getattr(trader.strategy, 'prices', None)
+                if prices:
+                    state[symbol] = {
+                        'prices': list(prices),
+                        'realtime_ticks': trader.realtime_ticks,
+                    }
+            if not state:
+                return
+            path = self._price_state_file()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+        except Exception as e:
+            logger.error(f"Failed to save price state: {e}")
+
+    def _restore_price_state(self):
+        """Prime strategies from the last session's price snapshot.
+
+        Only applied while the snapshot is fresh enough that the prices
+        are still representative (one warm-up window of wall time), so a
+        bot restarted overnight starts cold as before.
+        """
+        path = self._price_state_file()
+        try:
+            age = time.time() - os.path.getmtime(path)
+        except OSError:
+            return  # No snapshot from a previous session
+
+        try:
+            with open(path, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read price state: {e}")
+            return
+
+        restored = 0
+        for symbol, trader in self._trader_items:
+            saved = state.get(symbol)
+            if not saved or not hasattr(trader.strategy, 'add_price'):
+                continue
+            if age > max(60, trader.warmup_required * self.price_interval):
+                continue
+            for price in saved['prices']:
+                trader.strategy.add_price(price)
+            trader.realtime_ticks = saved.get('realtime_ticks', 0)
+            if trader.strategy.prices:
+                trader.last_price = trader.strategy.prices[-1]
+            self._restored_symbols.add(symbol)
+            restored += 1
+
+        if restored:
+            logger.info(f"Restored price buffers for {restored} stocks from last session - warm-up skipped")
+
+    def _on_position(self, pos):
+        """Keep the position cache current (fired by IB on every fill)"""
+        self._pos_by_symbol[pos.contract.symbol] = pos.position
+
     def get_position(self, trader: StockTrader) -> float:
-        """Get current position for a stock"""
-        positions = self.ib.positions()
-        for pos in positions:
-            if pos.contract.symbol == trader.symbol:
-                return pos.position
-        return 0
+        """Get current position for a stock (O(1) cache lookup)"""
+        return self._pos_by_symbol.get(trader.symbol, 0)
 
     def on_pending_tickers(self, tickers):
         """Process incoming ticks in real-time (called per-tick when TICK_MODE enabled)
@@ -1011,7 +1178,7 @@ class MultiStockBot:
         in parallel across multiple CPU cores using ProcessPoolExecutor.
         """
         stocks_to_evaluate = []  # Collect stocks that need signal evaluation
-        current_time = time.time()
+        current_time = time.monotonic()
 
         # Phase 1: Update all trader states (sequential, fast)
         for ticker in tickers:
@@ -1281,7 +1448,7 @@ class MultiStockBot:
         Used when multiprocessing is disabled or for single-stock evaluation.
         """
         symbol = trader.symbol
-        current_time = time.time()
+        current_time = time.monotonic()
 
         # Mark signal check time
         self.symbol_last_signal_check[symbol] = current_time
@@ -1379,14 +1546,14 @@ class MultiStockBot:
             else:
                 logger.info(f"[SELECTIVE RSI] {symbol}: Signal but already has position ({trader.position} shares)")
 
-    def update_cash_balance(self):
+    async def update_cash_balance_async(self):
         """Update available cash and net liquidation (cached, updated every 60s)"""
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_balance_check < 60:
             return  # Use cached values
 
         try:
-            account_summary = self.ib.accountSummary()
+            account_summary = await self.ib.accountSummaryAsync()
             for item in account_summary:
                 if item.tag == 'AvailableFunds':
                     self.available_cash_usd = float(item.value)
@@ -1398,6 +1565,10 @@ class MultiStockBot:
         except Exception as e:
             logger.error(f"Failed to update cash balance: {e}")
 
+    def update_cash_balance(self):
+        """Blocking wrapper for startup, before the event loop runs"""
+        self.ib.run(self.update_cash_balance_async())
+
     def place_order(self, trader: StockTrader, action: str, quantity: int):
         """Place an order with verification"""
         price = trader.last_price
@@ -1508,10 +1679,10 @@ class MultiStockBot:
             if trader.strategy_type == "BREAKOUT":
                 # Use breakout strategy's signal strength
                 signal_strength = trader.strategy.get_signal_strength() / 100.0  # Convert 0-100 to 0-1
-            elif hasattr(trader.strategy, 'long_window') and len(trader.strategy.prices) >= trader.strategy.long_window:
-                # MA strategy: calculate from MA distance
-                short_ma = sum(trader.strategy.prices[-trader.strategy.short_window:]) / trader.strategy.short_window
-                long_ma = sum(trader.strategy.prices[-trader.strategy.long_window:]) / trader.strategy.long_window
+            elif hasattr(trader.strategy, 'get_long_ma') and trader.strategy.get_long_ma():
+                # MA strategy: calculate from MA distance (cached rolling sums)
+                short_ma = trader.strategy.get_short_ma()
+                long_ma = trader.strategy.get_long_ma()
                 signal_strength = abs(short_ma - long_ma) / long_ma
             else:
                 signal_strength = 0.01  # Default for weak signal
@@ -1523,8 +1694,9 @@ class MultiStockBot:
             else:  # SELL
                 limit_price = round(price * 0.9985, 2)  # Accept 0.15% discount - ensure fill
 
-            order = LimitOrder(action, quantity, limit_price)
+            order = trader.take_order_template(action, quantity, limit_price)
             ib_trade = self.ib.placeOrder(trader.contract, order)
+            trader.note_order_placed(order, ib_trade)
 
             # Update trade record with order ID
             trade_verifier.update_order_id(trade_id, ib_trade.order.orderId)
@@ -1536,7 +1708,7 @@ class MultiStockBot:
             # Track order for timeout cancellation
             self.pending_orders[ib_trade.order.orderId] = {
                 'symbol': trader.symbol,
-                'time': time.time(),
+                'time': time.monotonic(),
                 'trade': ib_trade
             }
 
@@ -1578,12 +1750,13 @@ class MultiStockBot:
         thread.start()
 
     def collect_prices(self):
-        """Collect prices from IBKR streaming data"""
-        # Allow IB to process incoming data
-        self.ib.sleep(0.1)
+        """Collect prices from IBKR streaming data
 
+        Called from the asyncio price loop - the event loop pumps IB
+        messages continuously, so no explicit ib.sleep is needed here.
+        """
         collected = 0
-        for symbol, trader in self.traders.items():
+        for symbol, trader in self._trader_items:
             price = self.get_price(trader)
             if price:
                 # Get tick data from ticker
@@ -1633,13 +1806,13 @@ class MultiStockBot:
                 collected += 1
 
         # Flush tick files periodically (every 60 seconds)
-        if self.collect_tick_data and time.time() - self.last_tick_flush > 60:
+        if self.collect_tick_data and time.monotonic() - self.last_tick_flush > 60:
             for f in self.tick_files.values():
                 f.flush()
-            self.last_tick_flush = time.time()
+            self.last_tick_flush = time.monotonic()
 
         if collected > 0:
-            logger.info(f"Collected prices for {collected}/{len(self.traders)} stocks (IBKR)")
+            logger.info("Collected prices for %d/%d stocks (IBKR)", collected, len(self.traders))
             health_monitor.record_price_update(collected)
 
         # Record tick writes for health monitoring
@@ -1664,19 +1837,17 @@ class MultiStockBot:
                 regime = self.regime_detector.get_regime()
                 logger.info(f"Market Regime: {regime} ({self.regime_index}: ${price:.2f})")
 
-    def update_stock_info(self):
+    async def update_stock_info(self):
         """Update intraday price history from IBKR for sparkline charts, events and news from YFinance"""
-        current_time = time.time()
+        current_time = time.monotonic()
         intraday_updated = 0
-        events_updated = 0
-        news_updated = 0
 
-        for symbol, trader in self.traders.items():
+        for symbol, trader in self._trader_items:
             # Update intraday prices every 10 minutes
             if current_time - trader.last_intraday_update >= 600:
                 try:
                     # Fetch 1-day of 5-minute bars from IBKR
-                    bars = self.ib.reqHistoricalData(
+                    bars = await self.ib.reqHistoricalDataAsync(
                         trader.contract,
                         endDateTime='',
                         durationStr='1 D',
@@ -1690,40 +1861,64 @@ class MultiStockBot:
                         trader.last_intraday_update = current_time
                         intraday_updated += 1
                 except Exception as e:
-                    pass  # Silently skip failed updates
-
-            # Update events (earnings, dividends) and news every 1 hour
-            if current_time - trader.last_info_update >= 3600:  # 1 hour
-                try:
-                    # Fetch upcoming events
-                    events = self.yfinance_client.get_upcoming_events(symbol)
-                    trader.upcoming_events = events
-
-                    # Fetch latest news with VADER sentiment
-                    news = self.yfinance_client.get_news(symbol, limit=3)
-                    trader.news = news
-
-                    # Fetch analyst ratings (Buy/Hold/Sell)
-                    analyst = self.yfinance_client.get_analyst_ratings(symbol)
-                    if analyst:
-                        trader.analyst_ratings = analyst
-
-                    trader.last_info_update = current_time
-                    if events:  # Only count if we got data
-                        events_updated += 1
-                    if news:
-                        news_updated += 1
-                except Exception as e:
-                    pass  # Silently skip failed updates
+                    logger.warning(f"Intraday update failed for {symbol}: {e}")
+
+        # Update events (earnings, dividends) and news every 1 hour.
+        # These are blocking HTTP calls, so fan them out on the thread pool
+        # in the background - the main loop only checks for completion
+        if self._info_future is None or self._info_future.done():
+            stale = [(symbol, trader) for symbol, trader in self._trader_items
+                     if current_time - trader.last_info_update >= 3600]
+            if stale:
+                self._info_future = self._info_pool.submit(
+                    self._fetch_stock_info, stale, current_time
+                )
 
         if intraday_updated > 0:
             logger.info(f"Updated intraday charts for {intraday_updated} stocks (IBKR)")
+
+    def _fetch_stock_info(self, stale: list, current_time: float):
+        """Fetch events/news/ratings for stale traders concurrently.
+
+        Runs on the info pool; per-symbol fetches are fanned out across
+        the remaining workers. Results are whole-object swaps onto the
+        trader, so readers never see partial data.
+        """
+        events_updated = 0
+        news_updated = 0
+
+        for (symbol, trader), result in zip(
+                stale, self._info_pool.map(self._fetch_one_info,
+                                           [s for s, _ in stale])):
+            if result is None:
+                continue  # Failed fetch - retry on the next cycle
+            events, news, analyst = result
+            trader.upcoming_events = events
+            trader.news = news
+            if analyst:
+                trader.analyst_ratings = analyst
+            trader.last_info_update = current_time
+            if events:  # Only count if we got data
+                events_updated += 1
+            if news:
+                news_updated += 1
+
         if events_updated > 0:
             logger.info(f"Updated events for {events_updated} stocks (YFinance)")
         if news_updated > 0:
             logger.info(f"Updated news with VADER sentiment for {news_updated} stocks (YFinance)")
 
-    def check_signals(self):
+    def _fetch_one_info(self, symbol: str) -> tuple:
+        """Fetch (events, news, analyst_ratings) for one symbol"""
+        try:
+            events = self.yfinance_client.get_upcoming_events(symbol)
+            news = self.yfinance_client.get_news(symbol, limit=3)
+            analyst = self.yfinance_client.get_analyst_ratings(symbol)
+            return events, news, analyst
+        except Exception:
+            return None  # Silently skip failed updates
+
+    async def check_signals(self):
         """Check trading signals for all stocks with regime awareness and alpha engine"""
         # Get current market regime
         regime = 'UNKNOWN'
@@ -1733,7 +1928,7 @@ class MultiStockBot:
         # Phase 1: Compute signals and alpha scores for all stocks
         trade_candidates = []  # (symbol, trader, action, alpha_score, alpha_signal, stock_signal)
 
-        for symbol, trader in self.traders.items():
+        for symbol, trader in self._trader_items:
             if not self.ib.isConnected():
                 logger.warning("Not connected to IB")
                 continue
@@ -1750,13 +1945,13 @@ class MultiStockBot:
                 min_data = trader.strategy.long_window
 
             if len(trader.strategy.prices) < min_data:
-                logger.info(f"{symbol}: Collecting data ({len(trader.strategy.prices)}/{min_data})")
+                logger.info("%s: Collecting data (%d/%d)", symbol, len(trader.strategy.prices), min_data)
                 continue
 
             # CRITICAL: Require real-time warmup before trading
             # Historical daily bars are NOT sufficient for intraday breakout detection
             if trader.realtime_ticks < trader.warmup_required:
-                logger.info(f"{symbol}: Warmup ({trader.realtime_ticks}/{trader.warmup_required} ticks)")
+                logger.info("%s: Warmup (%d/%d ticks)", symbol, trader.realtime_ticks, trader.warmup_required)
                 continue
 
             trader.position = self.get_position(trader)
@@ -1789,9 +1984,13 @@ class MultiStockBot:
                 # Get final action from alpha engine (pass symbol for tick confirmation)
                 action = alpha_engine.get_action_for_signal(alpha_result, regime_action, int(trader.position), symbol)
 
-                logger.info(f"{symbol}: ${trader.last_price:.2f} | Pos: {trader.position} | Signal: {stock_signal} | Alpha: {alpha_score:+.2f} ({alpha_signal}) | Regime: {regime} | Action: {action}")
+                # %-style args skip string interpolation when INFO is disabled
+                logger.info("%s: $%.2f | Pos: %s | Signal: %s | Alpha: %+.2f (%s) | Regime: %s | Action: %s",
+                            symbol, trader.last_price, trader.position, stock_signal,
+                            alpha_score, alpha_signal, regime, action)
             else:
-                logger.info(f"{symbol}: ${trader.last_price:.2f} | Pos: {trader.position} | Signal: {stock_signal} | Regime: {regime} | Action: {action}")
+                logger.info("%s: $%.2f | Pos: %s | Signal: %s | Regime: %s | Action: %s",
+                            symbol, trader.last_price, trader.position, stock_signal, regime, action)
 
             # Sync strategy state with actual position
             if trader.position > 0 and not trader.strategy.in_position:
@@ -1813,7 +2012,12 @@ class MultiStockBot:
         if buys:
             logger.info(f"BUY candidates sorted by alpha: {[(s, f'{alpha:+.2f}') for s, t, a, alpha, asig, ssig in buys[:10]]}")
 
-        # Execute SELLs first (free up capital)
+        # Execute SELLs first (free up capital), then BUYs - orders are
+        # dispatched back-to-back (placeOrder is non-blocking, the event
+        # loop flushes them as soon as control returns) with a short gap
+        # every 10 to respect broker message rate limits
+        dispatched = 0
+
         for symbol, trader, action, alpha_score, alpha_signal, stock_signal in sells:
             sell_qty = min(int(trader.position), trader.position_size)
             if alpha_engine.enabled:
@@ -1823,6 +2027,9 @@ class MultiStockBot:
             if self.place_order(trader, 'SELL', sell_qty):
                 exit_reason = "Breakout breakdown" if trader.strategy_type == "BREAKOUT" else "MA crossover"
                 trader.strategy.exit_position(f"{exit_reason} ({regime} market)")
+                dispatched += 1
+                if dispatched % 10 == 0:
+                    await asyncio.sleep(0.1)
 
         # Execute BUYs sorted by alpha (highest first)
         for symbol, trader, action, alpha_score, alpha_signal, stock_signal in buys:
@@ -1832,6 +2039,10 @@ class MultiStockBot:
                 logger.info(f"{symbol}: BUY SIGNAL [{regime}] - Opening position")
             if self.place_order(trader, 'BUY', trader.position_size):
                 trader.strategy.enter_position(trader.last_price)
+                dispatched += 1
+                if dispatched % 10 == 0:
+                    await asyncio.sleep(0.1)
+
 
     def calculate_betas(self):
         """Calculate beta for all stocks vs URTH using 1 year of daily returns (stable)"""
@@ -1902,7 +2113,7 @@ class MultiStockBot:
             self._betas_calculated = True
 
             # Log some examples
-            betas = [(s, t.beta) for s, t in self.traders.items() if t.beta is not None]
+            betas = [(s, t.beta) for s, t in self._trader_items if t.beta is not None]
             betas.sort(key=lambda x: x[1], reverse=True)
             logger.info(f"Betas calculated for {len(betas)} stocks (1-year daily returns)")
             if betas:
@@ -1923,21 +2134,34 @@ class MultiStockBot:
             regime_state = self.regime_detector.get_state()
             current_regime = self.regime_detector.get_regime()
 
-        # Sync positions from IBKR for accurate dashboard display
-        try:
-            positions = self.ib.positions()
-            position_map = {pos.contract.symbol: pos.position for pos in positions}
-            for symbol, trader in self.traders.items():
-                trader.position = position_map.get(symbol, 0)
-        except Exception:
-            pass  # Use cached positions if sync fails
+        # Sync positions for accurate dashboard display - the cache is kept
+        # current by positionEvent, no per-cycle ib.positions() scan needed
+        pos_map = self._pos_by_symbol
+        for symbol, trader in self._trader_items:
+            trader.position = pos_map.get(symbol, 0)
 
         # Calculate beta vs MSCI World (URTH)
         self.calculate_betas()
 
+        # Batch-evaluate MA crossover strengths for all MA traders in one
+        # parallel kernel call (SoA over the cached rolling sums)
+        ma_hints = {}
+        ma_traders = [t for t in self._trader_list
+                      if t.strategy_type == "MA_CROSSOVER"]
+        if ma_traders:
+            short_mas = np.array([t.strategy.get_short_ma() for t in ma_traders])
+            long_mas = np.array([t.strategy.get_long_ma() for t in ma_traders])
+            thresholds = np.array([t.threshold for t in ma_traders])
+            # Vectorized rounding - no per-element round() dispatch
+            strengths = np.round(batch_strengths(short_mas, long_mas, thresholds), 1)
+            for i, t in enumerate(ma_traders):
+                ma_hints[t.symbol] = (float(short_mas[i]), float(long_mas[i]),
+                                      float(strengths[i]))
+
         states = []
-        for symbol, trader in self.traders.items():
-            state = trader.get_state(lightweight=True, regime=current_regime)
+        for symbol, trader in self._trader_items:
+            state = trader.get_state(lightweight=True, regime=current_regime,
+                                     ma_hint=ma_hints.get(symbol))
 
             # Add SELECTIVE_RSI indicators if strategy is active
             if self.strategy_type == "SELECTIVE_RSI" and self.selective_rsi:
@@ -1997,12 +2221,19 @@ class MultiStockBot:
         if hasattr(self, 'collector_process') and self.collector_process:
             collector_running = self.collector_process.poll() is None  # None means still running
 
+        # Re-format the display timestamp at most once per second - the
+        # dashboard only shows second resolution anyway
+        now_sec = int(time.time())
+        if now_sec != self._last_ts_sec:
+            self._last_ts_sec = now_sec
+            self._last_ts_iso = datetime.now().isoformat()
+
         state_data = {
             'multi_stock': True,
             'stocks': states,
             'is_connected': self.ib.isConnected(),
             'dry_run': self.dry_run,
-            'last_update': datetime.now().isoformat(),
+            'last_update': self._last_ts_iso,
             'regime_aware': self.regime_enabled,
             'regime': regime_state,
             'market_open': self.is_market_open(),
@@ -2021,14 +2252,26 @@ class MultiStockBot:
         # Update in-memory state (for backward compat)
         bot_state.update(**state_data)
 
-        # Also write to file for separate dashboard process
+        # Also write to file for separate dashboard process - but only
+        # when the payload actually changed, and at most once per second
         try:
-            import json
+            now = time.monotonic()
+            if now - self._last_state_write < 1.0:
+                return
+            if HAS_ORJSON:
+                payload = orjson.dumps(state_data, option=orjson.OPT_SERIALIZE_NUMPY)
+            else:
+                payload = json.dumps(state_data).encode('utf-8')
+            payload_hash = hash(payload)
+            if payload_hash == self._last_state_hash:
+                return  # Byte-identical - skip the disk write
             state_file = os.path.join(os.path.dirname(__file__), 'data', 'bot_state.json')
             os.makedirs(os.path.dirname(state_file), exist_ok=True)
             # Direct write (simpler, avoids Windows file locking issues with rename)
-            with open(state_file, 'w', encoding='utf-8') as f:
-                json.dump(state_data, f)
+            with open(state_file, 'wb') as f:
+                f.write(payload)
+            self._last_state_hash = payload_hash
+            self._last_state_write = now
         except Exception as e:
             logger.error(f"Failed to write state file: {e}")
 
@@ -2036,6 +2279,9 @@ class MultiStockBot:
         """Start the trading bot"""
         logger.info("Starting Multi-Stock Trading Bot...")
 
+        # Pay the Numba JIT compile cost now, not on the first tick
+        fast_ma_warmup()
+
         # Log timezone and market hours info
         from datetime import datetime
         import pytz
@@ -2134,58 +2380,77 @@ class MultiStockBot:
         logger.info(f"Collecting prices every {self.price_interval}s, checking trades every {self.trade_interval}s")
 
         # Health monitoring variables
-        self.last_price_update = time.time()
+        self.last_price_update = time.monotonic()
         self.last_health_check = 0
         self.stale_data_warned = False
         self.consecutive_stale_count = 0
 
+        # Run everything on ib_insync's asyncio loop - each job wakes at
+        # its own interval instead of a 10 Hz polling loop that usually
+        # has nothing to do
         try:
-            while True:
-                current_time = time.time()
-
-                # Collect prices (skip in tick mode - handled by callback)
-                if not self.tick_mode:
-                    if current_time - self.last_price_time >= self.price_interval:
-                        self.collect_prices()
-                        self.last_price_time = current_time
-                        self.last_price_update = current_time  # Track successful price update
-                        self.consecutive_stale_count = 0
-                        self.stale_data_warned = False
-
-                # Cancel timed-out orders (30 second timeout)
-                self.cancel_timed_out_orders()
-
-                # Health check every 30 seconds
-                if current_time - self.last_health_check >= 30:
-                    self._check_health(current_time)
-                    self.last_health_check = current_time
-
-                # Update events and news (every 5 minutes)
-                if current_time - self.last_info_time >= 300:
-                    self.update_stock_info()
-                    self.last_info_time = current_time
-
-                # Update cash balance (every 60 seconds)
-                self.update_cash_balance()
-
-                # Update dashboard
-                self.update_dashboard()
-
-                # Check signals (skip in tick mode - handled per-tick)
-                if not self.tick_mode:
-                    if current_time - self.last_trade_time >= self.trade_interval:
-                        self.check_signals()
-                        self.last_trade_time = current_time
-
-                # Faster loop in tick mode for responsiveness
-                self.ib.sleep(0.01 if self.tick_mode else 0.1)
-
+            self.ib.run(self._run_loops())
         except KeyboardInterrupt:
             logger.info("Shutting down...")
         finally:
             self.disconnect()
 
-    def _check_health(self, current_time):
+    async def _run_loops(self):
+        """Spawn the periodic jobs as asyncio tasks and run until cancelled"""
+        tasks = [
+            asyncio.ensure_future(self._info_loop()),
+            asyncio.ensure_future(self._maintenance_loop()),
+            asyncio.ensure_future(self._dashboard_loop()),
+        ]
+        # Price collection and signal checks are tick-driven in tick mode
+        if not self.tick_mode:
+            tasks.append(asyncio.ensure_future(self._price_loop()))
+            tasks.append(asyncio.ensure_future(self._trade_loop()))
+        await asyncio.gather(*tasks)
+
+    async def _price_loop(self):
+        """Collect streaming prices every price_interval seconds"""
+        while True:
+            await asyncio.sleep(self.price_interval)
+            self.collect_prices()
+            self.last_price_update = time.monotonic()  # Track successful price update
+            self.consecutive_stale_count = 0
+            self.stale_data_warned = False
+
+    async def _trade_loop(self):
+        """Check trading signals every trade_interval seconds"""
+        while True:
+            await asyncio.sleep(self.trade_interval)
+            await self.check_signals()
+
+    async def _info_loop(self):
+        """Update events and news every 5 minutes"""
+        while True:
+            await self.update_stock_info()
+            await asyncio.sleep(300)
+
+    async def _maintenance_loop(self):
+        """Order timeouts, cash balance and health checks (1 Hz)"""
+        while True:
+            await asyncio.sleep(1)
+            self.cancel_timed_out_orders()
+            await self.update_cash_balance_async()  # Cached internally, refreshes every 60s
+            current_time = time.monotonic()
+            if current_time - self.last_health_check >= 30:
+                await self._check_health(current_time)
+                self.last_health_check = current_time
+            # Persist price buffers on a 10s debounce for fast restarts
+            if current_time - self._last_price_state_save >= 10:
+                self._save_price_state()
+                self._last_price_state_save = current_time
+
+    async def _dashboard_loop(self):
+        """Push state to the dashboard at a capped 2 Hz"""
+        while True:
+            self.update_dashboard()
+            await asyncio.sleep(0.5)
+
+    async def _check_health(self, current_time):
         """Monitor system health: IBKR connection, data freshness, subprocess status"""
 
         # Update health monitor with current state
@@ -2201,8 +2466,8 @@ class MultiStockBot:
             logger.error("[HEALTH] IBKR DISCONNECTED - Attempting reconnect...")
             try:
                 self.ib.disconnect()
-                time.sleep(2)
-                self.connect()
+                await asyncio.sleep(2)
+                await self.connect_async()
                 logger.info("[HEALTH] IBKR reconnected successfully")
                 activity_logger.log_reconnect(True, "Connection restored")
             except Exception as e:
@@ -2222,8 +2487,8 @@ class MultiStockBot:
                 logger.error("[HEALTH] Persistent stale data - forcing IBKR reconnect")
                 try:
                     self.ib.disconnect()
-                    time.sleep(2)
-                    self.connect()
+                    await asyncio.sleep(2)
+                    await self.connect_async()
                     self.consecutive_stale_count = 0
                 except Exception as e:
                     logger.error(f"[HEALTH] Reconnect failed: {e}")
@@ -0,0 +1,22 @@
+"""Optional Numba JIT support
+
+Importing njit from here instead of numba keeps numba an optional
+dependency: when it isn't installed the decorator is a no-op and the
+decorated functions run as plain Python/NumPy.
+"""
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
@@ -1,15 +1,201 @@
 """Backtesting engine for trading strategies"""
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import repeat
 
-from src.database import init_db, save_prices, get_prices, get_price_count, save_backtest
+import numpy as np
+
+from src._njit import njit, prange
+
+from src.database import (init_db, save_prices, get_prices, get_price_count,
+                          save_backtest, save_earnings, get_earnings)
 from src.yfinance_client import YFinanceClient
 from src.strategy import calculate_rsi
 
 logger = logging.getLogger(__name__)
 
 
+def rolling_mean(values, window: int):
+    """Rolling mean over a 1-D array via one cumulative-sum pass
+
+    Entries before the window is full are NaN. One O(N) prefix sum
+    replaces the O(N*W) per-bar re-summing of the Python loop.
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    out = np.full(len(arr), np.nan)
+    if len(arr) < window:
+        return out
+    csum = np.cumsum(arr)
+    out[window - 1] = csum[window - 1] / window
+    out[window:] = (csum[window:] - csum[:-window]) / window
+    return out
+
+
+# Action codes emitted by the JIT'd bar loop
+_ACTION_BUY = 1
+_ACTION_SELL = 2
+_ACTION_STOP_LOSS = 3
+_ACTION_TRAIL_STOP = 4
+_ACTION_SELL_CLOSE = 5
+
+_ACTION_NAMES = {
+    _ACTION_BUY: 'BUY',
+    _ACTION_SELL: 'SELL',
+    _ACTION_STOP_LOSS: 'STOP_LOSS',
+    _ACTION_TRAIL_STOP: 'TRAIL_STOP',
+    _ACTION_SELL_CLOSE: 'SELL (CLOSE)',
+}
+
+
+@njit(cache=True, nogil=True)
+def _bt_loop(prices, short_ma, long_ma, signal_ok, buy_ok, sell_ok,
+             threshold, stop_loss_pct, trailing_stop_pct,
+             trail_after_profit_pct, min_hold_days, start_index, capital,
+             position_size):
+    """Path-dependent bar loop for the MA-crossover strategy
+
+    Covers MA signal + stop-loss + trailing stop + min-hold - only the
+    position state machine stays sequential. The RSI/volume/index
+    filters arrive pre-reduced as aligned boolean masks (signal_ok
+    gates signal evaluation, buy_ok/sell_ok gate entries and exits), so
+    each per-bar filter check is a single array load instead of
+    threshold compares; disabled filters pass all-True masks. Disabled
+    stops are passed as 0.0. Returns parallel trade-event arrays plus
+    the equity curve (one entry per simulated bar) and the final
+    capital.
+    """
+    n = len(prices)
+    actions = np.zeros(n + 1, dtype=np.int64)
+    trade_bar = np.zeros(n + 1, dtype=np.int64)
+    trade_qty = np.zeros(n + 1, dtype=np.int64)
+    trade_pnl = np.zeros(n + 1, dtype=np.float64)
+    n_trades = 0
+
+    # Series shorter than the long window: nothing to simulate (the
+    # bar range below is empty, so just avoid a negative allocation)
+    equity = np.empty(max(n - start_index, 0), dtype=np.float64)
+
+    position = 0
+    entry_price = 0.0
+    entry_day = 0
+    peak_price = 0.0
+
+    for i in range(start_index, n):
+        price = prices[i]
+
+        if position > 0 and price > peak_price:
+            peak_price = price
+        days_held = i - entry_day if position > 0 else 0
+
+        signal = 0
+
+        # Trailing stop (only after min hold and profit requirement)
+        if (position > 0 and days_held >= min_hold_days
+                and trailing_stop_pct > 0.0 and peak_price > 0.0):
+            trail_ok = True
+            if trail_after_profit_pct > 0.0 and entry_price > 0.0:
+                if (peak_price - entry_price) / entry_price < trail_after_profit_pct:
+                    trail_ok = False
+            if trail_ok and (peak_price - price) / peak_price >= trailing_stop_pct:
+                signal = _ACTION_TRAIL_STOP
+
+        # Stop-loss (always active - protect capital)
+        if (signal == 0 and position > 0 and stop_loss_pct > 0.0
+                and entry_price > 0.0):
+            if (entry_price - price) / entry_price >= stop_loss_pct:
+                signal = _ACTION_STOP_LOSS
+
+        # MA crossover (skipped entirely when volume is too low to trade)
+        if signal == 0 and signal_ok[i]:
+            sm = short_ma[i]
+            lm = long_ma[i]
+            if sm > lm * (1.0 + threshold):
+                if position == 0 and buy_ok[i]:
+                    signal = _ACTION_BUY
+            elif sm < lm * (1.0 - threshold):
+                if (position > 0 and days_held >= min_hold_days
+                        and sell_ok[i]):
+                    signal = _ACTION_SELL
+
+        # Execute
+        if signal == _ACTION_BUY:
+            quantity = min(position_size, int(capital / price))
+            if quantity > 0:
+                capital -= quantity * price
+                position = quantity
+                entry_price = price
+                entry_day = i
+                peak_price = price
+                actions[n_trades] = _ACTION_BUY
+                trade_bar[n_trades] = i
+                trade_qty[n_trades] = quantity
+                n_trades += 1
+        elif signal != 0 and position > 0:
+            revenue = position * price
+            actions[n_trades] = signal
+            trade_bar[n_trades] = i
+            trade_qty[n_trades] = position
+            trade_pnl[n_trades] = revenue - position * entry_price
+            n_trades += 1
+            capital += revenue
+            position = 0
+            entry_price = 0.0
+            entry_day = 0
+            peak_price = 0.0
+
+        equity[i - start_index] = capital + position * price
+
+    # Close any open position at the end
+    if position > 0:
+        price = prices[n - 1]
+        revenue = position * price
+        actions[n_trades] = _ACTION_SELL_CLOSE
+        trade_bar[n_trades] = n - 1
+        trade_qty[n_trades] = position
+        trade_pnl[n_trades] = revenue - position * entry_price
+        n_trades += 1
+        capital += revenue
+
+    return (actions[:n_trades], trade_bar[:n_trades], trade_qty[:n_trades],
+            trade_pnl[:n_trades], equity, capital)
+
+
+@njit(cache=True, parallel=True, nogil=True)
+def _grid_bt(prices, short_mas, long_mas, params, capital, position_size):
+    """Evaluate a whole parameter grid in one pass over the price array
+
+    params rows are (threshold, stop_loss_pct, trailing_stop_pct,
+    trail_after_profit_pct, min_hold_days, start_index). With numba
+    installed the grid fans out across cores via prange; the price
+    array stays cache-resident across parameter sets. Returns one row
+    (final_capital, winning_exits, total_exits) per parameter set.
+    """
+    n_params = params.shape[0]
+    out = np.empty((n_params, 3), dtype=np.float64)
+    all_ok = np.ones(prices.shape[0], dtype=np.bool_)
+    for p in prange(n_params):
+        actions, bars, qtys, pnls, equity, final_capital = _bt_loop(
+            prices, short_mas[p], long_mas[p], all_ok, all_ok, all_ok,
+            params[p, 0], params[p, 1], params[p, 2], params[p, 3],
+            int(params[p, 4]), int(params[p, 5]), capital, position_size
+        )
+        wins = 0
+        exits = 0
+        for k in range(len(actions)):
+            if actions[k] != _ACTION_BUY:
+                exits += 1
+                if pnls[k] > 0:
+                    wins += 1
+        out[p, 0] = final_capital
+        out[p, 1] = wins
+        out[p, 2] = exits
+    return out
+
+
 @dataclass
 class Trade:
     """Represents a single trade"""
@@ -106,6 +292,206 @@ class MomentumStrategy:
             name_parts.append(f"IDX:{int(index_drop_threshold*100)}%")
         self.name = " + ".join(name_parts)
 
+        # Vectorized indicator arrays, filled in by precompute_indicators()
+        self._short_ma = None
+        self._long_ma = None
+        self._rsi = None
+        self._rel_vol = None
+        self._idx_selloff = None
+        self._blackout = None
+        self._pead = None
+        self._rsi_cache = (None, 50.0)  # (key, value) for _rsi_at fallback
+
+    def set_params(self, **params):
+        """Reconfigure this strategy in place for another run
+
+        Accepts the same keyword arguments as __init__; anything not
+        given resets to its default, and the cached indicator arrays
+        are cleared so the next run recomputes them. Lets parameter
+        sweeps reuse one instance instead of constructing a fresh
+        strategy per set.
+        """
+        self.__init__(**params)
+
+    def precompute_indicators(self, prices: list, volumes: list = None,
+                              index_prices: list = None, dates: list = None,
+                              earnings_dates: list = None,
+                              earnings_data: dict = None):
+        """Precompute the rolling MAs (and filter series) for a full series
+
+        Called once by the backtester before the bar loop so get_signal
+        does array lookups per bar instead of re-summing windows.
+
+        The float series are stored as float32: indicator reads don't
+        need a 52-bit mantissa and halving the bytes halves the memory
+        bandwidth the bar loop pulls per bar. Price/equity accounting
+        stays float64.
+        """
+        self._short_ma = rolling_mean(prices, self.short_window).astype(np.float32)
+        self._long_ma = rolling_mean(prices, self.long_window).astype(np.float32)
+        self._rsi = (self._rsi_series(prices).astype(np.float32)
+                     if self.rsi_filter else None)
+        self._rel_vol = (self._rel_vol_series(volumes).astype(np.float32)
+                         if self.volume_filter and volumes is not None
+                         and len(volumes) else None)
+        self._idx_selloff = (self._idx_selloff_series(index_prices)
+                             if self.index_filter and index_prices else None)
+        self._blackout = (self._blackout_series(dates, earnings_dates)
+                          if self.fundamental_filter and dates
+                          and earnings_dates else None)
+        self._pead = (self._pead_series(dates, earnings_data)
+                      if self.pead_strategy and dates
+                      and earnings_data else None)
+
+    def _rsi_series(self, prices: list) -> np.ndarray:
+        """Full RSI series in one vectorized pass
+
+        Same math as calculate_rsi (simple average of the last rsi_period
+        gains/losses), but the rolling averages come from one prefix-sum
+        pass instead of an O(period) loop per bar.
+        """
+        arr = np.asarray(prices, dtype=np.float64)
+        out = np.full(len(arr), 50.0)  # Neutral default before warmup
+        if len(arr) <= self.rsi_period:
+            return out
+
+        changes = np.diff(arr)
+        gains = np.where(changes > 0, changes, 0.0)
+        losses = np.where(changes > 0, 0.0, -changes)
+        avg_gain = rolling_mean(gains, self.rsi_period)
+        avg_loss = rolling_mean(losses, self.rsi_period)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        rsi = np.where(avg_loss == 0.0, 100.0, rsi)
+
+        # Bar i uses the changes ending at diff index i-1
+        out[self.rsi_period:] = rsi[self.rsi_period - 1:]
+        return out
+
+    def _rel_vol_series(self, volumes: list) -> np.ndarray:
+        """Full relative-volume series in one vectorized pass
+
+        Same math as get_relative_volume: full-window volume MA once
+        volume_ma_period bars exist, expanding mean before that, and a
+        neutral 1.0 where the average is zero.
+        """
+        vol = np.asarray(volumes, dtype=np.float64)
+        n = len(vol)
+        csum = np.cumsum(vol)
+        ma = np.empty(n)
+        head = min(self.volume_ma_period, n)
+        ma[:head] = csum[:head] / np.arange(1, head + 1)
+        if n > self.volume_ma_period:
+            w = self.volume_ma_period
+            ma[w:] = (csum[w:] - csum[:-w]) / w
+        ma[0] = 0.0  # get_volume_ma returns 0 at the first bar
+        return np.where(ma > 0, vol / np.where(ma > 0, ma, 1.0), 1.0)
+
+    def _idx_selloff_series(self, index_prices: list,
+                            lookback: int = 5) -> np.ndarray:
+        """Boolean index-selloff mask in one vectorized pass
+
+        Same math as check_index_selloff: True where the index dropped
+        index_drop_threshold or more over the lookback period.
+        """
+        idx = np.asarray(index_prices, dtype=np.float64)
+        mask = np.zeros(len(idx), dtype=np.bool_)
+        if len(idx) <= lookback:
+            return mask
+        past = idx[:-lookback]
+        safe_past = np.where(past > 0, past, 1.0)
+        change = (idx[lookback:] - past) / safe_past
+        mask[lookback:] = (past > 0) & (change <= -self.index_drop_threshold)
+        return mask
+
+    @staticmethod
+    def _to_day64(value):
+        """Normalize a bar/earnings date to day-resolution datetime64
+
+        Accepts datetimes, pandas timestamps and ISO strings; returns
+        NaT for anything unparseable (matching the per-call helpers'
+        skip-on-parse-failure behavior).
+        """
+        try:
+            return np.datetime64(str(value)[:10])
+        except ValueError:
+            return np.datetime64('NaT')
+
+    def _blackout_series(self, dates: list, earnings_dates: list) -> np.ndarray:
+        """Boolean earnings-blackout mask in one pass per earnings date
+
+        Same math as check_earnings_blackout: True within
+        earnings_blackout_days before or after any earnings date.
+        """
+        bar_days = np.array([self._to_day64(d) for d in dates])
+        mask = np.zeros(len(dates), dtype=np.bool_)
+        for earnings_date in earnings_dates:
+            e_day = self._to_day64(earnings_date)
+            if np.isnat(e_day):
+                continue
+            delta = (bar_days - e_day).astype('timedelta64[D]').astype(np.int64)
+            mask |= np.abs(delta) <= self.earnings_blackout_days
+        mask[np.isnat(bar_days)] = False
+        return mask
+
+    def _pead_series(self, dates: list, earnings_data: dict) -> np.ndarray:
+        """Per-bar PEAD signal codes (0=none, 1=BUY, 2=SELL) in one pass
+
+        Same rules and earnings precedence as check_pead_signal: the
+        first earnings date (in dict order) whose window covers the bar
+        and whose surprise produces a signal wins; non-signaling matches
+        do not block later ones.
+        """
+        bar_days = np.array([self._to_day64(d) for d in dates])
+        codes = np.zeros(len(dates), dtype=np.int8)
+        for earnings_date, surprise_pct in earnings_data.items():
+            if surprise_pct is None:
+                continue
+            if surprise_pct > 0:
+                code = 1  # BUY on any beat
+            elif surprise_pct < -10:
+                code = 2  # SELL on a big miss
+            else:
+                continue
+            e_day = self._to_day64(earnings_date)
+            if np.isnat(e_day):
+                continue
+            days_after = (bar_days - e_day).astype('timedelta64[D]').astype(np.int64)
+            in_window = (days_after >= 0) & (days_after <= self.pead_window_days)
+            codes[in_window & (codes == 0) & ~np.isnat(bar_days)] = code
+        return codes
+
+    def _rsi_at(self, prices: list, index: int) -> float:
+        """RSI at one bar - cached series when precomputed, else per-bar math
+
+        The fallback keeps a length-1 cache so the two get_signal call
+        sites (PEAD path and crossover path) do not compute the same
+        bar's RSI twice.
+        """
+        if self._rsi is not None and index < len(self._rsi):
+            return self._rsi[index]
+        key = (id(prices), index)
+        if self._rsi_cache[0] == key:
+            return self._rsi_cache[1]
+        value = self.calculate_rsi(prices, index)
+        self._rsi_cache = (key, value)
+        return value
+
+    def _pead_at(self, index: int, current_date, earnings_data: dict):
+        """PEAD signal at one bar - cached codes when precomputed"""
+        if self._pead is not None and 0 <= index < len(self._pead):
+            return (None, 'BUY', 'SELL')[self._pead[index]]
+        signal, _reason = self.check_pead_signal(current_date, earnings_data)
+        return signal
+
+    def _blackout_at(self, index: int, current_date,
+                     earnings_dates: list) -> bool:
+        """Earnings blackout at one bar - cached mask when precomputed"""
+        if self._blackout is not None and 0 <= index < len(self._blackout):
+            return bool(self._blackout[index])
+        return self.check_earnings_blackout(current_date, earnings_dates)
+
     def calculate_rsi(self, prices: list, index: int) -> float:
         """Calculate RSI at a specific index"""
         if index < self.rsi_period:
@@ -160,15 +546,19 @@ class MomentumStrategy:
 
     def get_volume_ma(self, volumes: list, index: int) -> float:
         """Calculate average volume at a specific index"""
-        if not volumes or index < self.volume_ma_period:
-            if volumes and index > 0:
+        empty = volumes is None or len(volumes) == 0
+        if empty or index < self.volume_ma_period:
+            if not empty and index > 0:
                 return sum(volumes[:index+1]) / (index + 1)
             return 0
         return sum(volumes[index - self.volume_ma_period + 1:index + 1]) / self.volume_ma_period
 
     def get_relative_volume(self, volumes: list, index: int) -> float:
         """Calculate current volume relative to average (1.0 = average)"""
-        if not volumes or index < 0 or index >= len(volumes):
+        if self._rel_vol is not None and 0 <= index < len(self._rel_vol):
+            return self._rel_vol[index]
+        if (volumes is None or len(volumes) == 0
+                or index < 0 or index >= len(volumes)):
             return 1.0  # Default to neutral
         current_volume = volumes[index]
         avg_volume = self.get_volume_ma(volumes, index)
@@ -290,6 +680,10 @@ class MomentumStrategy:
         if not self.index_filter or not index_prices or idx < lookback:
             return False
 
+        if (lookback == 5 and self._idx_selloff is not None
+                and idx < len(self._idx_selloff)):
+            return bool(self._idx_selloff[idx])
+
         # Compare current index price to price N days ago
         current_idx = index_prices[idx]
         past_idx = index_prices[idx - lookback]
@@ -331,27 +725,30 @@ class MomentumStrategy:
 
         # PEAD strategy - check for post-earnings signal (overrides other signals)
         if self.pead_strategy and earnings_data:
-            pead_signal, pead_reason = self.check_pead_signal(current_date, earnings_data)
+            pead_signal = self._pead_at(index, current_date, earnings_data)
             if pead_signal == 'BUY' and entry_price == 0:
                 # Check RSI - don't chase overbought
-                rsi = self.calculate_rsi(prices, index) if self.rsi_filter else 50
+                rsi = self._rsi_at(prices, index) if self.rsi_filter else 50
                 if rsi <= self.rsi_overbought:
                     return 'BUY'  # PEAD buy signal
             elif pead_signal == 'SELL' and entry_price > 0:
                 return 'SELL'  # PEAD sell signal
 
         # Earnings blackout - block trades near earnings (only if not using PEAD)
-        if not self.pead_strategy and current_date and self.check_earnings_blackout(current_date, earnings_dates):
+        if not self.pead_strategy and current_date and self._blackout_at(index, current_date, earnings_dates):
             return 'HOLD'  # Earnings blackout
 
-        # Get price window ending at index
-        window = prices[index - self.long_window + 1:index + 1]
-
-        short_ma = sum(window[-self.short_window:]) / self.short_window
-        long_ma = sum(window) / self.long_window
+        # Use precomputed MA arrays when available, else sum the window
+        if self._long_ma is not None and index < len(self._long_ma):
+            short_ma = self._short_ma[index]
+            long_ma = self._long_ma[index]
+        else:
+            window = prices[index - self.long_window + 1:index + 1]
+            short_ma = sum(window[-self.short_window:]) / self.short_window
+            long_ma = sum(window) / self.long_window
 
         # Calculate RSI for filtering
-        rsi = self.calculate_rsi(prices, index) if self.rsi_filter else 50
+        rsi = self._rsi_at(prices, index) if self.rsi_filter else 50
 
         # BUY signal with RSI filter, volume filter, and index filter
         if short_ma > long_ma * (1 + self.threshold):
@@ -386,13 +783,55 @@ class Backtester:
         self.position_size = position_size
         self.index_symbol = index_symbol  # e.g., 'KWEB', 'SPY', 'QQQ'
 
+    @staticmethod
+    def _fetch_earnings(symbol: str):
+        """Fetch earnings dates from Yahoo Finance into the SQLite cache
+
+        Called on a cache miss so subsequent runs read from the
+        database. Surprise percentages come from the 'Surprise(%)'
+        column when Yahoo reports them (NaN rows are stored as None).
+        """
+        try:
+            import yfinance as yf
+            df = yf.Ticker(symbol).get_earnings_dates(limit=24)
+            if df is None or df.empty:
+                logger.warning("No earnings dates from Yahoo Finance for %s", symbol)
+                return
+            rows = []
+            for ts, row in df.iterrows():
+                surprise = row.get('Surprise(%)')
+                # NaN != NaN - store unknown surprises as None
+                surprise = float(surprise) if surprise == surprise else None
+                rows.append((ts.to_pydatetime(), surprise))
+            save_earnings(symbol, rows)
+        except Exception as e:
+            logger.warning("Earnings fetch failed for %s: %s", symbol, e)
+
+    @staticmethod
+    def _known_earnings() -> list:
+        """NIO quarterly earnings schedule with surprise data
+
+        Fallback for symbols with no rows in the earnings cache.
+        Format: (date, surprise_pct) - positive = beat, negative = miss.
+        """
+        return [
+            (datetime(2025, 11, 25), 27.4),  # Q3 2025 - beat by 27.4%
+            (datetime(2025, 9, 9), 15.2),    # Q2 2025 - beat by 15.2%
+            (datetime(2025, 6, 10), 8.5),    # Q1 2025 - beat by 8.5%
+            (datetime(2025, 3, 4), -5.3),    # Q4 2024 - miss by 5.3%
+            (datetime(2024, 12, 10), 12.1),  # Q3 2024 - beat by 12.1%
+            (datetime(2024, 9, 10), -8.7),   # Q2 2024 - miss by 8.7%
+            (datetime(2024, 6, 6), 22.3),    # Q1 2024 - beat by 22.3%
+            (datetime(2024, 3, 5), 5.8),     # Q4 2023 - beat by 5.8%
+        ]
+
     def fetch_data(self, symbol: str, period: str = '1y') -> list:
         """Fetch and cache historical data"""
         # Check if we have data in DB
         count = get_price_count(symbol)
 
         if count < 200:  # Need more data
-            logger.info(f"Fetching {symbol} data from Yahoo Finance...")
+            logger.info("Fetching %s data from Yahoo Finance...", symbol)
             client = YFinanceClient()
             history = client.get_history(symbol, period)
 
@@ -403,58 +842,198 @@ class Backtester:
                 logger.error("Failed to fetch data")
                 return []
 
-        logger.info(f"Using {count} cached prices for {symbol}")
+        logger.info("Using %d cached prices for %s", count, symbol)
         return get_prices(symbol)
 
-    def run(self, symbol: str, strategy, period: str = '1y') -> BacktestResult:
-        """Run backtest on historical data"""
-        # Get stock data
+    def _cache_path(self, symbol: str, period: str) -> str:
+        """Path of the columnar .npz cache for a (symbol, period) pair"""
+        return os.path.join('data', f"{symbol}_{period}.npz")
+
+    def fetch_data_arrays(self, symbol: str, period: str = '1y'):
+        """Fetch historical data as (close, volume, date) columns
+
+        Wraps fetch_data with a columnar .npz cache so warm runs load
+        three NumPy arrays directly instead of materializing SQLite rows
+        into a list of dicts and re-extracting each column per run.
+        Returns None when no data is available.
+        """
+        path = self._cache_path(symbol, period)
+        if os.path.exists(path):
+            logger.info("Loading columnar cache %s", path)
+            with np.load(path) as cached:
+                return cached['close'], cached['volume'], cached['date']
+
         data = self.fetch_data(symbol, period)
         if not data:
-            raise ValueError("No data available for backtesting")
+            return None
+
+        close = np.array([d['close'] for d in data], dtype=np.float64)
+        volume = np.array([d.get('volume', 0) or 0 for d in data],
+                          dtype=np.float64)
+        # Keep dates as their original string form so downstream
+        # [:10] parsing behaves exactly like the list-of-dicts path
+        date = np.array([str(d.get('date') or d.get('timestamp'))
+                         for d in data])
+        try:
+            os.makedirs('data', exist_ok=True)
+            np.savez_compressed(path, close=close, volume=volume, date=date)
+        except OSError as e:
+            logger.warning("Could not write columnar cache %s: %s", path, e)
+        return close, volume, date
+
+    def _run_jit(self, strategy, prices: list, dates: list):
+        """Run the compiled bar loop and rebuild the trade/equity accounting
+
+        Returns (trades, equity_curve, final_capital, daily_returns,
+        max_drawdown, peak_equity) matching what the Python bar loop
+        produces for the same inputs.
+        """
+        start_index = strategy.long_window
+        price_arr = np.asarray(prices, dtype=np.float64)
+
+        # Reduce each filter to an aligned boolean mask up front so the
+        # kernel gates on single array loads; disabled filters pass
+        # all-True masks
+        n = len(price_arr)
+        if strategy.rsi_filter and strategy._rsi is not None:
+            rsi_ok = strategy._rsi <= strategy.rsi_overbought
+        else:
+            rsi_ok = np.ones(n, dtype=np.bool_)
+
+        if strategy.volume_filter and strategy._rel_vol is not None:
+            rel_vol = strategy._rel_vol
+            signal_ok = rel_vol >= strategy.volume_min_threshold
+            vol_conf_ok = rel_vol >= strategy.volume_confirm_threshold
+        else:
+            signal_ok = np.ones(n, dtype=np.bool_)
+            vol_conf_ok = np.ones(n, dtype=np.bool_)
+
+        if strategy.index_filter and strategy._idx_selloff is not None:
+            no_selloff = ~strategy._idx_selloff
+        else:
+            no_selloff = np.ones(n, dtype=np.bool_)
+
+        buy_ok = rsi_ok & vol_conf_ok & no_selloff
+        sell_ok = vol_conf_ok & no_selloff
+
+        actions, trade_bar, trade_qty, trade_pnl, equity, final_capital = _bt_loop(
+            price_arr, strategy._short_ma, strategy._long_ma,
+            signal_ok, buy_ok, sell_ok,
+            float(strategy.threshold),
+            float(strategy.stop_loss_pct or 0.0),
+            float(strategy.trailing_stop_pct or 0.0),
+            float(strategy.trail_after_profit_pct or 0.0),
+            int(strategy.min_hold_days or 0),
+            start_index, float(self.initial_capital), int(self.position_size)
+        )
+
+        trades = []
+        for k in range(len(actions)):
+            action = _ACTION_NAMES[actions[k]]
+            bar = trade_bar[k]
+            quantity = int(trade_qty[k])
+            value = quantity * price_arr[bar]
+            trades.append(Trade(
+                date=dates[bar],
+                action=action,
+                price=price_arr[bar],
+                quantity=quantity,
+                value=value,
+                pnl=float(trade_pnl[k]) if action != 'BUY' else 0
+            ))
+
+        equity_curve = [{'date': dates[start_index + k], 'equity': float(e)}
+                        for k, e in enumerate(equity)]
+
+        if len(equity) > 0:
+            # Prepend initial capital so returns/peaks start from it,
+            # mirroring the incremental tracking of the Python loop
+            full = np.concatenate(([self.initial_capital], equity))
+            daily_returns = (np.diff(full) / full[:-1]).tolist()
+            peaks = np.maximum.accumulate(full)[1:]
+            max_drawdown = float(np.max(peaks - equity))
+            peak_equity = float(peaks[-1])
+        else:
+            daily_returns = []
+            max_drawdown = 0
+            peak_equity = self.initial_capital
+
+        return (trades, equity_curve, float(final_capital), daily_returns,
+                max_drawdown, peak_equity)
+
+    def run(self, symbol: str, strategy, period: str = '1y',
+            data: list = None) -> BacktestResult:
+        """Run backtest on historical data
 
-        prices = [d['close'] for d in data]
-        volumes = [d.get('volume', 0) for d in data]
-        dates = [d.get('date') or d.get('timestamp') for d in data]
+        Pass pre-fetched data to reuse one price series across several runs
+        (e.g. parameter sweeps) instead of re-fetching per run.
+        """
+        # Get stock data (unless the caller already fetched it)
+        if data is None:
+            arrays = self.fetch_data_arrays(symbol, period)
+            if arrays is None:
+                raise ValueError("No data available for backtesting")
+            close, volume, date = arrays
+            prices = close
+            volumes = volume
+            dates = date.tolist()
+        else:
+            if not data:
+                raise ValueError("No data available for backtesting")
+            # Contiguous float buffers instead of Python float lists -
+            # downstream precomputes reuse them without a copy
+            prices = np.fromiter((d['close'] for d in data),
+                                 dtype=np.float64, count=len(data))
+            volumes = np.fromiter((d.get('volume', 0) or 0 for d in data),
+                                  dtype=np.float64, count=len(data))
+            dates = [d.get('date') or d.get('timestamp') for d in data]
 
         # Get earnings dates and data if fundamental filter or PEAD is enabled
         earnings_dates = []
         earnings_data = {}  # date -> surprise_pct mapping for PEAD
         if strategy.fundamental_filter or strategy.pead_strategy:
-            # NIO quarterly earnings schedule with surprise data
-            # Format: (date, surprise_pct) - positive = beat, negative = miss
+            # Prefer the SQLite earnings cache (populated via
+            # save_earnings); fall back to the known NIO schedule
             from datetime import datetime
-            known_earnings_with_surprise = [
-                (datetime(2025, 11, 25), 27.4),  # Q3 2025 - beat by 27.4%
-                (datetime(2025, 9, 9), 15.2),    # Q2 2025 - beat by 15.2%
-                (datetime(2025, 6, 10), 8.5),    # Q1 2025 - beat by 8.5%
-                (datetime(2025, 3, 4), -5.3),    # Q4 2024 - miss by 5.3%
-                (datetime(2024, 12, 10), 12.1),  # Q3 2024 - beat by 12.1%
-                (datetime(2024, 9, 10), -8.7),   # Q2 2024 - miss by 8.7%
-                (datetime(2024, 6, 6), 22.3),    # Q1 2024 - beat by 22.3%
-                (datetime(2024, 3, 5), 5.8),     # Q4 2023 - beat by 5.8%
-            ]
+            cached_earnings = get_earnings(symbol)
+            if not cached_earnings:
+                # Populate the cache from Yahoo Finance on a miss so
+                # real symbols don't silently fall through to the
+                # hardcoded NIO schedule
+                self._fetch_earnings(symbol)
+                cached_earnings = get_earnings(symbol)
+            if cached_earnings:
+                known_earnings_with_surprise = [
+                    (datetime.strptime(str(r['earnings_date'])[:10], '%Y-%m-%d'),
+                     r['surprise_pct'])
+                    for r in cached_earnings
+                ]
+                logger.info("Using %d cached earnings dates for %s",
+                            len(known_earnings_with_surprise), symbol)
+            else:
+                known_earnings_with_surprise = self._known_earnings()
             earnings_dates = [e[0] for e in known_earnings_with_surprise]
             earnings_data = {e[0]: e[1] for e in known_earnings_with_surprise}
-            logger.info(f"Using {len(earnings_dates)} known earnings dates")
+            logger.info("Using %d known earnings dates", len(earnings_dates))
             if strategy.pead_strategy:
-                logger.info(f"PEAD strategy enabled: {strategy.pead_window_days} day window")
+                logger.info("PEAD strategy enabled: %d day window", strategy.pead_window_days)
 
         # Get index data if index filter is enabled
         index_prices = None
         if self.index_symbol and strategy.index_filter:
-            logger.info(f"Fetching index data: {self.index_symbol}")
-            index_data = self.fetch_data(self.index_symbol, period)
-            if index_data:
-                # Align index data with stock data by date
-                index_by_date = {str(d.get('date') or d.get('timestamp'))[:10]: d['close']
-                                 for d in index_data}
-                index_prices = []
-                for d in dates:
-                    date_key = str(d)[:10]
-                    idx_price = index_by_date.get(date_key, 0)
-                    index_prices.append(idx_price)
-                logger.info(f"Loaded {len([p for p in index_prices if p > 0])} index prices")
+            logger.info("Fetching index data: %s", self.index_symbol)
+            idx_days, idx_close = _index_series(self.index_symbol, period)
+            if idx_days is not None:
+                # Align index data with stock data by date: one sorted
+                # searchsorted join instead of a per-bar dict lookup
+                # (the cached series is in ascending date order)
+                bar_days = np.array([MomentumStrategy._to_day64(d)
+                                     for d in dates])
+                pos = np.searchsorted(idx_days, bar_days)
+                pos = np.clip(pos, 0, len(idx_days) - 1)
+                valid = idx_days[pos] == bar_days  # NaT never matches
+                index_prices = np.where(valid, idx_close[pos], 0.0).tolist()
+                logger.info("Loaded %d index prices", int(valid.sum()))
 
         # Initialize state
         capital = self.initial_capital
@@ -468,13 +1047,27 @@ class Backtester:
 
         max_drawdown = 0
         daily_returns = []
-        prev_equity = capital
 
-        logger.info(f"Running backtest: {symbol} with {strategy.name}")
-        logger.info(f"Period: {dates[0]} to {dates[-1]} ({len(prices)} bars)")
+        logger.info("Running backtest: %s with %s", symbol, strategy.name)
+        logger.info("Period: %s to %s (%d bars)", dates[0], dates[-1], len(prices))
+
+        # Precompute the indicator arrays once for the whole series
+        strategy.precompute_indicators(prices, volumes, index_prices,
+                                       dates, earnings_dates, earnings_data)
+
+        # Fast path: everything except the date-driven earnings/PEAD
+        # logic runs through the compiled bar loop on precomputed arrays
+        use_fast_loop = not (strategy.fundamental_filter
+                             or strategy.pead_strategy)
+        if use_fast_loop:
+            (trades, equity_curve, capital, daily_returns,
+             max_drawdown, peak_equity) = self._run_jit(strategy, prices, dates)
+            sim_bars = range(0)  # bar loop already done
+        else:
+            sim_bars = range(strategy.long_window, len(prices))
 
         # Run simulation
-        for i in range(strategy.long_window, len(prices)):
+        for i in sim_bars:
             price = prices[i]
             date = dates[i]
 
@@ -493,23 +1086,11 @@ class Backtester:
                                          earnings_dates,
                                          earnings_data)
 
-            # Calculate current equity
+            # Calculate current equity (returns/drawdown computed
+            # vectorized after the loop)
             equity = capital + (position * price)
             equity_curve.append({'date': date, 'equity': equity})
 
-            # Track daily returns
-            if prev_equity > 0:
-                daily_return = (equity - prev_equity) / prev_equity
-                daily_returns.append(daily_return)
-            prev_equity = equity
-
-            # Track drawdown
-            if equity > peak_equity:
-                peak_equity = equity
-            drawdown = peak_equity - equity
-            if drawdown > max_drawdown:
-                max_drawdown = drawdown
-
             # Execute trades
             if signal == 'BUY' and position == 0:
                 # Buy
@@ -601,23 +1182,38 @@ class Backtester:
             ))
             position = 0
 
+        # Returns/peak/drawdown for the Python path in one accumulate
+        # pass, mirroring _run_jit (fast path already returned its own)
+        if not use_fast_loop and equity_curve:
+            full = np.concatenate(([float(self.initial_capital)],
+                                   [e['equity'] for e in equity_curve]))
+            prev = full[:-1]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rets = np.diff(full) / prev
+            daily_returns = rets[prev > 0].tolist()
+            peaks = np.maximum.accumulate(full)
+            max_drawdown = float(np.max(peaks[1:] - full[1:]))
+            peak_equity = float(peaks[-1])
+
         # Calculate results
         final_capital = capital
         total_return = final_capital - self.initial_capital
         total_return_pct = (total_return / self.initial_capital) * 100
 
         # Win/loss stats (include all exit types)
-        sell_trades = [t for t in trades if t.action in ('SELL', 'SELL (CLOSE)', 'STOP_LOSS', 'TRAIL_STOP')]
-        winning = [t for t in sell_trades if t.pnl > 0]
-        losing = [t for t in sell_trades if t.pnl <= 0]
-        win_rate = len(winning) / len(sell_trades) * 100 if sell_trades else 0
+        exit_pnl = np.array([t.pnl for t in trades
+                             if t.action in ('SELL', 'SELL (CLOSE)', 'STOP_LOSS', 'TRAIL_STOP')])
+        num_exits = len(exit_pnl)
+        winning = int((exit_pnl > 0).sum())
+        losing = num_exits - winning
+        win_rate = winning / num_exits * 100 if num_exits else 0
 
         # Sharpe ratio (annualized, assuming daily data)
         if daily_returns and len(daily_returns) > 1:
-            import statistics
-            avg_return = statistics.mean(daily_returns)
-            std_return = statistics.stdev(daily_returns)
-            sharpe = (avg_return / std_return) * (252 ** 0.5) if std_return > 0 else 0
+            returns_arr = np.asarray(daily_returns)
+            avg_return = returns_arr.mean()
+            std_return = returns_arr.std(ddof=1)  # sample stdev
+            sharpe = float(avg_return / std_return * np.sqrt(252)) if std_return > 0 else 0
         else:
             sharpe = 0
 
@@ -626,15 +1222,15 @@ class Backtester:
         result = BacktestResult(
             symbol=symbol,
             strategy=strategy.name,
-            start_date=str(dates[strategy.long_window]),
+            start_date=str(dates[min(strategy.long_window, len(dates) - 1)]),
             end_date=str(dates[-1]),
             initial_capital=self.initial_capital,
             final_capital=final_capital,
             total_return=total_return,
             total_return_pct=total_return_pct,
             num_trades=len(trades),
-            winning_trades=len(winning),
-            losing_trades=len(losing),
+            winning_trades=winning,
+            losing_trades=losing,
             win_rate=win_rate,
             max_drawdown=max_drawdown,
             max_drawdown_pct=max_dd_pct,
@@ -745,6 +1341,24 @@ def print_equity_curve(equity_curve: list, width=50, height=10):
     print()
 
 
+@lru_cache(maxsize=32)
+def _index_series(symbol: str, period: str):
+    """Index close series as (day64, close) arrays, cached per process
+
+    Sweeps with an index filter hit the same (symbol, period) on every
+    run; the LRU makes the fetch and per-row materialization a one-time
+    cost instead of one per backtest. Returns (None, None) when no data
+    is available.
+    """
+    data = Backtester().fetch_data(symbol, period)
+    if not data:
+        return None, None
+    days = np.array([MomentumStrategy._to_day64(
+        d.get('date') or d.get('timestamp')) for d in data])
+    close = np.array([d['close'] for d in data], dtype=np.float64)
+    return days, close
+
+
 def run_backtest(symbol: str = 'NIO', period: str = '1y', capital: float = 10000,
                  position_size: int = 15, short_ma: int = 10, long_ma: int = 30,
                  stop_loss_pct: float = None, trailing_stop_pct: float = None,
@@ -754,7 +1368,8 @@ def run_backtest(symbol: str = 'NIO', period: str = '1y', capital: float = 10000
                  volume_filter: bool = False, volume_ma_period: int = 20,
                  volume_confirm_threshold: float = 1.5, volume_min_threshold: float = 0.5,
                  fundamental_filter: bool = False, earnings_blackout_days: int = 3,
-                 pead_strategy: bool = False, pead_window_days: int = 7):
+                 pead_strategy: bool = False, pead_window_days: int = 7,
+                 data: list = None, verbose: bool = True, strategy=None):
     """Run a backtest with configurable settings
 
     Args:
@@ -780,8 +1395,12 @@ def run_backtest(symbol: str = 'NIO', period: str = '1y', capital: float = 10000
         earnings_blackout_days: Days before/after earnings to avoid trading
         pead_strategy: Enable Post-Earnings Announcement Drift strategy
         pead_window_days: Days after earnings to consider PEAD signal
+        data: Pre-fetched price data (skips fetch_data when provided)
+        verbose: Print the full results report after the run
+        strategy: Existing MomentumStrategy to reconfigure and reuse
+            (avoids re-constructing one per run in sweeps)
     """
-    strategy = MomentumStrategy(
+    strategy_params = dict(
         short_window=short_ma,
         long_window=long_ma,
         threshold=0.01,
@@ -802,16 +1421,162 @@ def run_backtest(symbol: str = 'NIO', period: str = '1y', capital: float = 10000
         pead_strategy=pead_strategy,
         pead_window_days=pead_window_days
     )
+    if strategy is None:
+        strategy = MomentumStrategy(**strategy_params)
+    else:
+        strategy.set_params(**strategy_params)
     backtester = Backtester(
         initial_capital=capital,
         position_size=position_size,
         index_symbol=index_symbol
     )
-    result = backtester.run(symbol, strategy, period)
-    print_results(result)
+    result = backtester.run(symbol, strategy, period, data=data)
+    if verbose:
+        print_results(result)
     return result
 
 
+def _run_param_set(data: list, param_set: dict, symbol: str,
+                   capital: float, position_size: int,
+                   strategy=None) -> dict:
+    """One filtered backtest for a sweep - module-level so process-pool
+    workers can pickle it by name"""
+    r = run_backtest(symbol=symbol, capital=capital,
+                     position_size=position_size,
+                     data=data, verbose=False, strategy=strategy,
+                     **param_set)
+    return {
+        'final_capital': r.final_capital,
+        'total_return_pct': r.total_return_pct,
+        'win_rate': r.win_rate,
+        'winning_trades': r.winning_trades,
+        'closed_trades': r.winning_trades + r.losing_trades,
+    }
+
+
+def run_sweep(symbol: str, param_sets: list, period: str = '1y',
+              capital: float = 10000, position_size: int = 15,
+              max_workers: int = None) -> list:
+    """Run a parameter sweep for one symbol, fetching the data once
+
+    Thin wrapper over run_grid_backtest that amortizes the data fetch
+    across the whole grid and enables the process pool for the filtered
+    parameter sets (each backtest is independent and CPU-bound).
+    max_workers defaults to the CPU count.
+    """
+    backtester = Backtester(initial_capital=capital,
+                            position_size=position_size)
+    data = backtester.fetch_data(symbol, period)
+    if not data:
+        raise ValueError(f"No data available for {symbol}")
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    return run_grid_backtest(data, param_sets, symbol=symbol,
+                             capital=capital, position_size=position_size,
+                             max_workers=max_workers)
+
+
+def run_grid_backtest(data: list, param_sets: list, symbol: str = 'GRID',
+                      capital: float = 10000, position_size: int = 15,
+                      max_workers: int = None) -> list:
+    """Evaluate many parameter sets over one price series in a single pass
+
+    Each entry of param_sets is a dict of run_backtest-style kwargs
+    (short_ma, long_ma, stop_loss_pct, ...). Sets the compiled kernel
+    supports (no RSI/volume/earnings/index filters) are batched through
+    _grid_bt so the whole grid shares one cache-resident price array;
+    anything else falls back to individual run_backtest calls, fanned
+    out across a process pool when max_workers is set (they are
+    embarrassingly parallel).
+
+    Duplicate parameter sets (same key/value tuple) are computed once
+    and the result is shared - grids re-run after a crash or built from
+    overlapping ranges often repeat tuples, and each set is pure in
+    (params, data).
+
+    Returns one result dict per param set, in input order, with
+    final_capital, total_return_pct, win_rate, winning_trades and
+    closed_trades.
+    """
+    prices = np.asarray([d['close'] for d in data], dtype=np.float64)
+    results = [None] * len(param_sets)
+
+    first_of = {}
+    dup_of = {}
+    fast_idx = []
+    slow_idx = []
+    for i, ps in enumerate(param_sets):
+        key = tuple(sorted(ps.items()))
+        if key in first_of:
+            dup_of[i] = first_of[key]
+            continue
+        first_of[key] = i
+        if (ps.get('rsi_filter') or ps.get('volume_filter')
+                or ps.get('fundamental_filter') or ps.get('pead_strategy')
+                or ps.get('index_filter')):
+            # Filtered strategies need the full engine
+            slow_idx.append(i)
+        else:
+            fast_idx.append(i)
+
+    if slow_idx:
+        slow_sets = [param_sets[i] for i in slow_idx]
+        if max_workers and max_workers > 1 and len(slow_idx) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                outs = list(pool.map(_run_param_set,
+                                     repeat(data), slow_sets,
+                                     repeat(symbol), repeat(capital),
+                                     repeat(position_size)))
+        else:
+            # Serial path: one strategy reconfigured per set via
+            # set_params instead of a fresh instance per run
+            shared = MomentumStrategy()
+            outs = [_run_param_set(data, ps, symbol, capital,
+                                   position_size, strategy=shared)
+                    for ps in slow_sets]
+        for i, out in zip(slow_idx, outs):
+            results[i] = out
+
+    if fast_idx:
+        n = len(prices)
+        # float32 MA rows: same downcast as precompute_indicators, and
+        # twice as many parameter sets fit in cache for the grid kernel
+        short_mas = np.empty((len(fast_idx), n), dtype=np.float32)
+        long_mas = np.empty((len(fast_idx), n), dtype=np.float32)
+        params = np.empty((len(fast_idx), 6), dtype=np.float64)
+        for row, i in enumerate(fast_idx):
+            ps = param_sets[i]
+            short_ma = ps.get('short_ma', 10)
+            long_ma = ps.get('long_ma', 30)
+            short_mas[row] = rolling_mean(prices, short_ma)
+            long_mas[row] = rolling_mean(prices, long_ma)
+            params[row] = (
+                ps.get('threshold', 0.01),
+                ps.get('stop_loss_pct') or 0.0,
+                ps.get('trailing_stop_pct') or 0.0,
+                ps.get('trail_after_profit_pct') or 0.0,
+                ps.get('min_hold_days') or 0,
+                long_ma,
+            )
+
+        grid_out = _grid_bt(prices, short_mas, long_mas, params,
+                            float(capital), int(position_size))
+        for row, i in enumerate(fast_idx):
+            final_capital, wins, exits = grid_out[row]
+            results[i] = {
+                'final_capital': final_capital,
+                'total_return_pct': (final_capital - capital) / capital * 100,
+                'win_rate': wins / exits * 100 if exits else 0,
+                'winning_trades': int(wins),
+                'closed_trades': int(exits),
+            }
+
+    for i, j in dup_of.items():
+        results[i] = dict(results[j])
+
+    return results
+
+
 if __name__ == '__main__':
     logging.basicConfig(level=logging.INFO, format='%(message)s')
 
@@ -1,4 +1,5 @@
 import os
+import asyncio
 import time
 import logging
 import threading
@@ -61,7 +62,7 @@ class TradingBot:
                 self.alpha_vantage = AlphaVantageClient()
                 logger.info("Alpha Vantage backup data source enabled")
             except ValueError as e:
-                logger.warning(f"Alpha Vantage disabled: {e}")
+                logger.warning("Alpha Vantage disabled: %s", e)
                 self.enable_alpha_vantage = False
 
         # Yahoo Finance backup data source (free, unlimited historical data)
@@ -75,7 +76,7 @@ class TradingBot:
                 self.yfinance = YFinanceClient()
                 logger.info("Yahoo Finance backup data source enabled")
             except Exception as e:
-                logger.warning(f"Yahoo Finance disabled: {e}")
+                logger.warning("Yahoo Finance disabled: %s", e)
                 self.enable_yfinance = False
 
         self.contract = Stock(self.symbol, self.exchange, self.currency)
@@ -93,7 +94,7 @@ class TradingBot:
                 self.fundamental_client = FundamentalDataClient(blackout_days=self.earnings_blackout_days)
                 logger.info("Fundamental data filter enabled")
             except Exception as e:
-                logger.warning(f"Fundamental data disabled: {e}")
+                logger.warning("Fundamental data disabled: %s", e)
                 self.use_fundamental_filter = False
 
         # Earnings analyzer for post-earnings signals (PEAD strategy)
@@ -128,6 +129,7 @@ class TradingBot:
         self.index_fetch_interval = 3600  # Fetch index once per hour
 
         self.position = 0
+        self._pos_by_symbol = {}  # symbol -> position, kept fresh by positionEvent
         self.last_bid = 0
         self.last_ask = 0
         self.last_price = 0
@@ -135,31 +137,45 @@ class TradingBot:
         self.limit_offset = 0.01
         self.ticker = None
 
-        self.last_price_time = 0
-        self.last_trade_time = 0
-
         mode = "DRY RUN" if self.dry_run else "LIVE TRADING"
-        logger.info(f"Bot initialized - Symbol: {self.symbol}, Port: {self.port}, Mode: {mode}")
-        logger.info(f"Price collection: every {self.price_interval}s, Trade check: every {self.trade_interval}s")
-        logger.info(f"Volume filter: confirm>{self.strategy.volume_confirm_threshold}x, min>{self.strategy.volume_min_threshold}x (MA{self.strategy.volume_ma_period})")
-        logger.info(f"Fundamental filter: {'ENABLED' if self.use_fundamental_filter else 'DISABLED'}")
-        logger.info(f"Alpha Vantage backup: {'ENABLED' if self.enable_alpha_vantage else 'DISABLED'}")
-        logger.info(f"Yahoo Finance backup: {'ENABLED' if self.enable_yfinance else 'DISABLED'}")
+        logger.info("Bot initialized - Symbol: %s, Port: %s, Mode: %s",
+                    self.symbol, self.port, mode)
+        logger.info("Price collection: every %ss, Trade check: every %ss",
+                    self.price_interval, self.trade_interval)
+        logger.info("Volume filter: confirm>%sx, min>%sx (MA%s)",
+                    self.strategy.volume_confirm_threshold, self.strategy.volume_min_threshold, self.strategy.volume_ma_period)
+        logger.info("Fundamental filter: %s",
+                    ('ENABLED' if self.use_fundamental_filter else 'DISABLED'))
+        logger.info("Alpha Vantage backup: %s",
+                    ('ENABLED' if self.enable_alpha_vantage else 'DISABLED'))
+        logger.info("Yahoo Finance backup: %s", ('ENABLED' if self.enable_yfinance else 'DISABLED'))
         if not self.dry_run:
             logger.warning("WARNING:  LIVE TRADING ENABLED - Real money will be used!")
 
-    def connect(self):
+    async def connect_async(self):
+        """Connect to IB; safe to call from tasks on the live event loop"""
         try:
-            self.ib.connect(self.host, self.port, clientId=self.client_id)
-            logger.info(f"Connected to IB Gateway at {self.host}:{self.port}")
-
-            self.ib.qualifyContracts(self.contract)
-            logger.info(f"Contract qualified: {self.contract}")
+            await self.ib.connectAsync(self.host, self.port,
+                                       clientId=self.client_id)
+            logger.info("Connected to IB Gateway at %s:%s", self.host, self.port)
+
+            await self.ib.qualifyContractsAsync(self.contract)
+            logger.info("Contract qualified: %s", self.contract)
+
+            # Event-driven position cache: seed once, then keep it
+            # current from positionEvent instead of re-querying per cycle
+            self._pos_by_symbol = {p.contract.symbol: p.position
+                                   for p in self.ib.positions()}
+            self.ib.positionEvent += self._on_position
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to IB: {e}")
+            logger.error("Failed to connect to IB: %s", e)
             return False
 
+    def connect(self):
+        """Blocking connect for startup, before the event loop runs"""
+        return self.ib.run(self.connect_async())
+
     def disconnect(self):
         if self.ticker:
             self.ib.cancelMktData(self.contract)
@@ -172,7 +188,8 @@ class TradingBot:
         # Request delayed data if live not available (type 3 = delayed)
         self.ib.reqMarketDataType(3)
         self.ticker = self.ib.reqMktData(self.contract, '', False, False)
-        logger.info(f"Started streaming market data for {self.symbol} (delayed if no subscription)")
+        logger.info("Started streaming market data for %s (delayed if no subscription)",
+                    self.symbol)
 
     def load_historical_data(self):
         """Fetch historical data for dashboard chart, fallback to Alpha Vantage"""
@@ -191,7 +208,7 @@ class TradingBot:
                 formatDate=1
             )
         except Exception as e:
-            logger.warning(f"IB historical data failed: {e}")
+            logger.warning("IB historical data failed: %s", e)
 
         # Fallback to Alpha Vantage if IB fails
         if not bars and self.alpha_vantage:
@@ -222,7 +239,8 @@ class TradingBot:
                     last_price_update=datetime.now(),
                     is_live_streaming=False
                 )
-                logger.info(f"Loaded {len(intraday)} bars from Alpha Vantage (last price: ${self.last_price:.2f})")
+                logger.info("Loaded %s bars from Alpha Vantage (last price: $%.2f)",
+                            len(intraday), self.last_price)
                 return
 
         # Fallback to Yahoo Finance if Alpha Vantage also fails
@@ -259,7 +277,8 @@ class TradingBot:
                     last_price_update=datetime.now(),
                     is_live_streaming=False
                 )
-                logger.info(f"Loaded {len(history)} bars from Yahoo Finance (last price: ${self.last_price:.2f})")
+                logger.info("Loaded %s bars from Yahoo Finance (last price: $%.2f)",
+                            len(history), self.last_price)
                 return
 
         if bars:
@@ -297,8 +316,9 @@ class TradingBot:
                 last_price_update=last_bar_time,
                 is_live_streaming=False
             )
-            logger.info(f"Loaded {len(bars)} historical bars from IB (last price: ${self.last_price:.2f})")
-            logger.info(f"Historical MAs - Short: ${short_ma:.4f}, Long: ${long_ma:.4f}")
+            logger.info("Loaded %s historical bars from IB (last price: $%.2f)",
+                        len(bars), self.last_price)
+            logger.info("Historical MAs - Short: $%.4f, Long: $%.4f", short_ma, long_ma)
         else:
             logger.warning("No historical data received from IB or Alpha Vantage")
 
@@ -337,7 +357,8 @@ class TradingBot:
                 self.last_ask = quote['price']
                 self.last_volume = quote.get('volume', 0) or self.last_volume
                 self.data_source = 'ALPHA_VANTAGE'
-                logger.info(f"Using Alpha Vantage price: ${quote['price']:.2f}, volume: {self.last_volume:,}")
+                logger.info("Using Alpha Vantage price: $%.2f, volume: %d",
+                            quote['price'], self.last_volume)
                 return quote['price']
 
         # Try Yahoo Finance as last resort
@@ -350,19 +371,20 @@ class TradingBot:
                 self.last_ask = quote['price']
                 self.last_volume = quote.get('volume', 0) or self.last_volume
                 self.data_source = 'YFINANCE'
-                logger.info(f"Using Yahoo Finance price: ${quote['price']:.2f}, volume: {self.last_volume:,}")
+                logger.info("Using Yahoo Finance price: $%.2f, volume: %d",
+                            quote['price'], self.last_volume)
                 return quote['price']
 
         return None
 
+    def _on_position(self, position):
+        """Keep the position cache in sync with IB position events"""
+        self._pos_by_symbol[position.contract.symbol] = position.position
+
     def get_position(self):
-        positions = self.ib.positions()
-        for pos in positions:
-            if pos.contract.symbol == self.symbol:
-                return pos.position
-        return 0
+        return self._pos_by_symbol.get(self.symbol, 0)
 
-    def place_order(self, action, quantity):
+    async def place_order(self, action, quantity):
         mid_price = (self.last_bid + self.last_ask) / 2
         if action == 'BUY':
             limit_price = round(mid_price + self.limit_offset, 2)
@@ -370,17 +392,21 @@ class TradingBot:
             limit_price = round(mid_price - self.limit_offset, 2)
 
         if self.dry_run:
-            logger.info(f"[DRY RUN] Would place {action} LIMIT order for {quantity} shares of {self.symbol} at ${limit_price:.2f}")
-            logger.info(f"[DRY RUN] Bid: ${self.last_bid:.2f}, Ask: ${self.last_ask:.2f}, Mid: ${mid_price:.2f}")
+            logger.info("[DRY RUN] Would place %s LIMIT order for %s shares of %s at $%.2f",
+                        action, quantity, self.symbol, limit_price)
+            logger.info("[DRY RUN] Bid: $%.2f, Ask: $%.2f, Mid: $%.2f",
+                        self.last_bid, self.last_ask, mid_price)
             return None
 
         try:
             # Use OrderConfirmation for verified trading
             confirmer = OrderConfirmation(self.ib)
-            logger.info(f"Placing verified order: {action} {quantity} {self.symbol} at ${limit_price:.2f}")
-            logger.info(f"Bid: ${self.last_bid:.2f}, Ask: ${self.last_ask:.2f}, Mid: ${mid_price:.2f}")
+            logger.info("Placing verified order: %s %s %s at $%.2f",
+                        action, quantity, self.symbol, limit_price)
+            logger.info("Bid: $%.2f, Ask: $%.2f, Mid: $%.2f",
+                        self.last_bid, self.last_ask, mid_price)
 
-            success, message, details = confirmer.place_and_confirm(
+            success, message, details = await confirmer.place_and_confirm_async(
                 symbol=self.symbol,
                 action=action,
                 quantity=quantity,
@@ -389,16 +415,18 @@ class TradingBot:
             )
 
             if success:
-                logger.info(f"VERIFIED: {message}")
-                logger.info(f"Position: {details['position_before']} -> {details['position_after']}")
+                logger.info("VERIFIED: %s", message)
+                logger.info("Position: %s -> %s",
+                            details['position_before'], details['position_after'])
             else:
-                logger.error(f"VERIFICATION FAILED: {message}")
+                logger.error("VERIFICATION FAILED: %s", message)
                 if details:
-                    logger.error(f"Details: position_before={details.get('position_before')}, position_after={details.get('position_after')}, status={details.get('status')}")
+                    logger.error("Details: position_before=%s, position_after=%s, status=%s",
+                                 details.get('position_before'), details.get('position_after'), details.get('status'))
 
             return details
         except Exception as e:
-            logger.error(f"Error placing order: {e}")
+            logger.error("Error placing order: %s", e)
             return None
 
     def collect_price(self):
@@ -407,7 +435,8 @@ class TradingBot:
         if price:
             self.strategy.add_price(price)
             self.strategy.add_volume(self.last_volume)
-            logger.debug(f"Price collected: ${price:.2f}, Volume: {self.last_volume:,} (total: {len(self.strategy.prices)})")
+            logger.debug("Price collected: $%.2f, Volume: %d (total: %s)",
+                         price, self.last_volume, len(self.strategy.prices))
             return True
         return False
 
@@ -470,9 +499,9 @@ class TradingBot:
                 if history:
                     self.index_prices = [bar['close'] for bar in history]
                     self.last_index_fetch = current_time
-                    logger.info(f"Fetched {len(self.index_prices)} {self.index_symbol} prices")
+                    logger.info("Fetched %s %s prices", len(self.index_prices), self.index_symbol)
         except Exception as e:
-            logger.warning(f"Failed to fetch index prices: {e}")
+            logger.warning("Failed to fetch index prices: %s", e)
 
     def fetch_fundamental_data(self):
         """Fetch fundamental data (earnings, news, analyst ratings)"""
@@ -484,7 +513,7 @@ class TradingBot:
             return  # Already fetched recently
 
         try:
-            logger.info(f"Fetching fundamental data for {self.symbol}...")
+            logger.info("Fetching fundamental data for %s...", self.symbol)
             data = self.fundamental_client.get_all_fundamental_data(self.symbol)
             self.strategy.update_fundamental_data(data)
             self.last_fundamental_fetch = current_time
@@ -495,12 +524,18 @@ class TradingBot:
             analyst = data.get('analyst_rating')
 
             if earnings and earnings.next_earnings_date:
-                logger.info(f"Earnings: {earnings.days_until_earnings} days until {earnings.next_earnings_date.strftime('%Y-%m-%d')}, blackout: {earnings.in_blackout_period}")
+                logger.info("Earnings: %s days until %s, blackout: %s",
+                            earnings.days_until_earnings, earnings.next_earnings_date.strftime('%Y-%m-%d'), earnings.in_blackout_period)
 
-            logger.info(f"News: {news_sentiment} ({news_score:.2f}), Analyst: {analyst.recommendation if analyst else 'N/A'} ({analyst.score:.1f}/5)" if analyst else f"News: {news_sentiment}")
+            if analyst:
+                logger.info("News: %s (%.2f), Analyst: %s (%.1f/5)",
+                            news_sentiment, news_score,
+                            analyst.recommendation, analyst.score)
+            else:
+                logger.info("News: %s", news_sentiment)
 
         except Exception as e:
-            logger.error(f"Failed to fetch fundamental data: {e}")
+            logger.error("Failed to fetch fundamental data: %s", e)
 
     def fetch_earnings_signal(self):
         """Fetch earnings signal for post-earnings trading (PEAD strategy)"""
@@ -509,7 +544,7 @@ class TradingBot:
             return  # Already checked recently
 
         try:
-            logger.info(f"Checking earnings signal for {self.symbol}...")
+            logger.info("Checking earnings signal for %s...", self.symbol)
 
             # Get earnings signal
             signal, strength, reason = self.earnings_analyzer.get_earnings_signal(self.symbol)
@@ -518,21 +553,21 @@ class TradingBot:
             just_released = self.earnings_analyzer.check_earnings_just_released(self.symbol, hours=168)
 
             if just_released and signal in ('strong_buy', 'buy', 'strong_sell', 'sell'):
-                logger.info(f"EARNINGS SIGNAL: {signal} (strength: {strength:.2f})")
-                logger.info(f"Reason: {reason}")
+                logger.info("EARNINGS SIGNAL: %s (strength: %.2f)", signal, strength)
+                logger.info("Reason: %s", reason)
                 self.strategy.update_earnings_signal(signal, strength, reason)
             else:
                 # Clear earnings signal if no recent earnings or neutral
                 self.strategy.update_earnings_signal(None, 0, None)
                 if just_released:
-                    logger.info(f"Earnings just released but signal is neutral: {reason}")
+                    logger.info("Earnings just released but signal is neutral: %s", reason)
                 else:
                     logger.debug("No recent earnings release")
 
             self.last_earnings_check = current_time
 
         except Exception as e:
-            logger.error(f"Failed to fetch earnings signal: {e}")
+            logger.error("Failed to fetch earnings signal: %s", e)
 
     def is_index_dropping(self) -> bool:
         """Check if the index is in a selloff"""
@@ -549,25 +584,28 @@ class TradingBot:
         is_dropping = change <= -self.index_drop_threshold
 
         if is_dropping:
-            logger.info(f"{self.index_symbol} down {change*100:.1f}% over {self.index_lookback} days - market selloff")
+            logger.info("%s down %.1f%% over %s days - market selloff",
+                        self.index_symbol, change*100, self.index_lookback)
 
         return is_dropping
 
-    def check_trade_signal(self):
+    async def check_trade_signal(self):
         """Check for trade signals and execute if needed"""
         if not self.ib.isConnected():
             logger.warning("Not connected to IB, attempting reconnect...")
-            if not self.connect():
+            if not await self.connect_async():
                 return
 
         price = self.last_price
         if price <= 0:
             return
 
-        logger.info(f"{self.symbol} price: ${price:.2f} | Bid: ${self.last_bid:.2f} Ask: ${self.last_ask:.2f}")
+        logger.info("%s price: $%.2f | Bid: $%.2f Ask: $%.2f",
+                    self.symbol, price, self.last_bid, self.last_ask)
 
         self.position = self.get_position()
-        logger.info(f"Current position: {self.position} shares | Prices collected: {len(self.strategy.prices)}")
+        logger.info("Current position: %s shares | Prices collected: %s",
+                    self.position, len(self.strategy.prices))
 
         # Sync strategy position state with actual position
         if self.position > 0 and not self.strategy.in_position:
@@ -591,46 +629,49 @@ class TradingBot:
         # Log strategy status
         status = self.strategy.get_status()
         if self.strategy.in_position:
-            logger.info(f"Position: entry=${status['entry_price']:.2f}, peak=${status['peak_price']:.2f}, "
-                       f"held={status['periods_held']} periods, PnL=${status['unrealized_pnl']:.2f}")
+            logger.info("Position: entry=$%.2f, peak=$%.2f, "
+                        "held=%s periods, PnL=$%.2f",
+                        status['entry_price'], status['peak_price'],
+                        status['periods_held'], status['unrealized_pnl'])
 
         # Execute trades based on signal
         if signal == 'BUY' and self.position == 0:
-            logger.info(f"Signal: BUY - Opening position")
-            result = self.place_order('BUY', self.position_size)
+            logger.info("Signal: BUY - Opening position")
+            result = await self.place_order('BUY', self.position_size)
             if result or self.dry_run:
                 self.strategy.enter_position(price)
 
         elif signal == 'SELL' and self.position > 0:
             sell_qty = min(abs(self.position), self.position_size)
-            logger.info(f"Signal: SELL (MA crossover) - Closing position ({sell_qty} shares)")
-            result = self.place_order('SELL', sell_qty)
+            logger.info("Signal: SELL (MA crossover) - Closing position (%s shares)", sell_qty)
+            result = await self.place_order('SELL', sell_qty)
             if result or self.dry_run:
                 self.strategy.exit_position("MA crossover sell")
 
         elif signal == 'STOP_LOSS' and self.position > 0:
             sell_qty = min(abs(self.position), self.position_size)
-            logger.warning(f"Signal: STOP-LOSS - Protecting capital ({sell_qty} shares)")
-            result = self.place_order('SELL', sell_qty)
+            logger.warning("Signal: STOP-LOSS - Protecting capital (%s shares)", sell_qty)
+            result = await self.place_order('SELL', sell_qty)
             if result or self.dry_run:
                 self.strategy.exit_position("Stop-loss triggered")
 
         elif signal == 'TRAILING_STOP' and self.position > 0:
             sell_qty = min(abs(self.position), self.position_size)
-            logger.info(f"Signal: TRAILING STOP - Locking in profits ({sell_qty} shares)")
-            result = self.place_order('SELL', sell_qty)
+            logger.info("Signal: TRAILING STOP - Locking in profits (%s shares)", sell_qty)
+            result = await self.place_order('SELL', sell_qty)
             if result or self.dry_run:
                 self.strategy.exit_position("Trailing stop triggered")
         elif signal == 'SELL' and self.position <= 0:
-            logger.info(f"Signal: SELL - No position to sell (avoiding short)")
+            logger.info("Signal: SELL - No position to sell (avoiding short)")
         else:
-            logger.info(f"Signal: {signal} - No action")
+            logger.info("Signal: %s - No action", signal)
 
     def start(self):
         logger.info("Starting trading bot...")
 
         if not self.dry_run:
-            logger.warning(f"WARNING:  LIVE TRADING MODE - Position size: {self.position_size} shares of {self.symbol}")
+            logger.warning("WARNING:  LIVE TRADING MODE - Position size: %s shares of %s",
+                           self.position_size, self.symbol)
             logger.warning("Press Ctrl+C within 5 seconds to abort...")
             time.sleep(5)
 
@@ -651,36 +692,47 @@ class TradingBot:
                 daemon=True
             )
             dashboard_thread.start()
-            logger.info(f"Dashboard started at http://localhost:{self.dashboard_port}")
+            logger.info("Dashboard started at http://localhost:%s", self.dashboard_port)
 
-        logger.info(f"Collecting prices every {self.price_interval}s, checking trades every {self.trade_interval}s")
+        logger.info("Collecting prices every %ss, checking trades every %ss",
+                    self.price_interval, self.trade_interval)
         logger.info("Waiting for price data...")
 
         try:
-            while True:
-                current_time = time.time()
-
-                # Collect price at regular intervals
-                if current_time - self.last_price_time >= self.price_interval:
-                    self.collect_price()
-                    self.last_price_time = current_time
-
-                # Update dashboard state
-                self.update_dashboard_state()
-
-                # Check for trade signals at regular intervals
-                if current_time - self.last_trade_time >= self.trade_interval:
-                    self.check_trade_signal()
-                    self.last_trade_time = current_time
-
-                # Small sleep to prevent CPU spinning
-                self.ib.sleep(0.1)
-
+            # Run the periodic jobs as asyncio tasks on ib_insync's event
+            # loop instead of polling a 10 Hz while/sleep scheduler
+            self.ib.run(self._run_loops())
         except KeyboardInterrupt:
             logger.info("Shutting down...")
         finally:
             self.disconnect()
 
+    async def _run_loops(self):
+        """Spawn the periodic jobs as asyncio tasks and run until cancelled"""
+        await asyncio.gather(
+            asyncio.ensure_future(self._price_loop()),
+            asyncio.ensure_future(self._trade_loop()),
+            asyncio.ensure_future(self._dashboard_loop()),
+        )
+
+    async def _price_loop(self):
+        """Collect streaming prices every price_interval seconds"""
+        while True:
+            await asyncio.sleep(self.price_interval)
+            self.collect_price()
+
+    async def _trade_loop(self):
+        """Check trading signals every trade_interval seconds"""
+        while True:
+            await asyncio.sleep(self.trade_interval)
+            await self.check_trade_signal()
+
+    async def _dashboard_loop(self):
+        """Refresh the dashboard state twice per second"""
+        while True:
+            await asyncio.sleep(0.5)
+            self.update_dashboard_state()
+
 
 if __name__ == '__main__':
     bot = TradingBot()
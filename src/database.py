@@ -72,9 +72,23 @@ def init_db():
         )
     ''')
 
+    # Earnings dates cache (with optional surprise % for PEAD)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS earnings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            symbol TEXT NOT NULL,
+            earnings_date DATE NOT NULL,
+            surprise_pct REAL,
+            source TEXT,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(symbol, earnings_date)
+        )
+    ''')
+
     # Create indexes
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_prices_symbol_ts ON prices(symbol, timestamp)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_symbol ON trades(symbol)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_earnings_symbol ON earnings(symbol)')
 
     conn.commit()
     conn.close()
@@ -161,6 +175,54 @@ def get_price_count(symbol: str) -> int:
     return count
 
 
+def save_earnings(symbol: str, earnings: list, source: str = 'yfinance'):
+    """Save earnings dates to the cache
+
+    Args:
+        symbol: Stock symbol
+        earnings: List of (date, surprise_pct) tuples; surprise_pct may
+            be None when unknown
+        source: Data source name
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    count = 0
+    for earnings_date, surprise_pct in earnings:
+        try:
+            cursor.execute('''
+                INSERT OR REPLACE INTO earnings (symbol, earnings_date, surprise_pct, source)
+                VALUES (?, ?, ?, ?)
+            ''', (symbol, str(earnings_date)[:10], surprise_pct, source))
+            count += 1
+        except Exception as e:
+            logger.warning(f"Failed to insert earnings date: {e}")
+
+    conn.commit()
+    conn.close()
+    logger.info(f"Saved {count} earnings dates for {symbol}")
+    return count
+
+
+def get_earnings(symbol: str) -> list:
+    """Get cached earnings dates for a symbol
+
+    Returns:
+        List of earnings dicts (earnings_date, surprise_pct), oldest first
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute(
+        'SELECT * FROM earnings WHERE symbol = ? ORDER BY earnings_date ASC',
+        (symbol,)
+    )
+    rows = cursor.fetchall()
+    conn.close()
+
+    return [dict(row) for row in rows]
+
+
 def save_backtest(result: dict):
     """Save backtest result"""
     conn = get_connection()
@@ -0,0 +1,84 @@
+"""
+JIT-compiled MA crossover math for the per-tick hot path.
+
+The numeric kernels are compiled with Numba when it is installed and run
+as plain Python otherwise (see src/_njit.py). StockTrader stays a normal
+Python object - only the arithmetic lives here.
+"""
+import numpy as np
+
+from src._njit import njit, prange, HAS_NUMBA
+
+
+@njit(cache=True, fastmath=True)
+def crossover_strength(short_ma: float, long_ma: float, threshold: float) -> float:
+    """Signal strength on the dashboard scale: -100 (SELL) to +100 (BUY).
+
+    Same formula as the MA crossover thresholds: +/-100 outside the
+    threshold band around long_ma, scaled linearly in between.
+    """
+    if long_ma == 0.0:
+        return 0.0
+
+    buy_threshold = long_ma * (1.0 + threshold)
+    sell_threshold = long_ma * (1.0 - threshold)
+    threshold_range = buy_threshold - sell_threshold
+
+    if threshold_range == 0.0:
+        return 0.0
+
+    if short_ma >= buy_threshold:
+        return 100.0
+    if short_ma <= sell_threshold:
+        return -100.0
+
+    position = (short_ma - sell_threshold) / threshold_range
+    return position * 200.0 - 100.0
+
+
+@njit(cache=True, fastmath=True)
+def ma_signal(prices: np.ndarray, short_window: int, long_window: int,
+              threshold: float):
+    """Compute (short_ma, long_ma, strength) from the tail of a price array.
+
+    Used where no incremental rolling sums are available (e.g. backfilled
+    histories); per-tick callers should prefer SimpleStrategy's cached sums.
+    """
+    n = prices.shape[0]
+    if n < long_window:
+        return 0.0, 0.0, 0.0
+
+    s = 0.0
+    for i in range(n - short_window, n):
+        s += prices[i]
+    short_ma = s / short_window
+
+    s = 0.0
+    for i in range(n - long_window, n):
+        s += prices[i]
+    long_ma = s / long_window
+
+    return short_ma, long_ma, crossover_strength(short_ma, long_ma, threshold)
+
+
+@njit(cache=True, parallel=True)
+def batch_strengths(short_mas: np.ndarray, long_mas: np.ndarray,
+                    thresholds: np.ndarray) -> np.ndarray:
+    """Crossover strengths for all symbols in one parallel kernel call.
+
+    Takes the MAs structure-of-arrays style so N symbols cost one
+    dispatch instead of N Python-level calls per dashboard update.
+    """
+    n = short_mas.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        out[i] = crossover_strength(short_mas[i], long_mas[i], thresholds[i])
+    return out
+
+
+def warmup():
+    """Trigger JIT compilation once at startup so the first tick is not
+    charged the compile cost. No-op when Numba is unavailable."""
+    if HAS_NUMBA:
+        ma_signal(np.zeros(4, dtype=np.float64), 2, 3, 0.003)
+        batch_strengths(np.zeros(2), np.ones(2), np.full(2, 0.003))
@@ -648,9 +648,11 @@ class MarketStateEngine:
                 'XLP': 'Consumer Staples',
             }
 
+            # One batched request for all sector ETFs instead of six round trips
+            quotes = self.yf_client.get_quotes(list(etfs))
             returns = {}
             for symbol, name in etfs.items():
-                quote = self.yf_client.get_quote(symbol)
+                quote = quotes.get(symbol)
                 if quote and quote.get('price', 0) > 0:
                     price = quote['price']
                     prev = quote.get('previous_close', price)
@@ -43,6 +43,14 @@ class ConnectionManager:
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
 
+    async def broadcast(self, payload: str):
+        """Send one pre-serialized payload to every connected client"""
+        for websocket in list(self.active_connections):
+            try:
+                await websocket.send_text(payload)
+            except Exception:
+                self.disconnect(websocket)
+
 
 manager = ConnectionManager()
 
@@ -4398,15 +4406,35 @@ async def get_alpha_cake():
 """
 
 
+async def state_broadcaster():
+    """Push bot state to all websocket clients once per second
+
+    The state is read and serialized a single time per tick and the
+    same JSON string fans out to every connection, instead of each
+    client loop re-reading the file and re-building the payload
+    independently.
+    """
+    while True:
+        if manager.active_connections:
+            # Use thread pool to avoid blocking event loop with file I/O
+            state = await asyncio.to_thread(read_state_file)
+            await manager.broadcast(json.dumps(state))
+        await asyncio.sleep(1)
+
+
+@app.on_event("startup")
+async def start_broadcaster():
+    asyncio.create_task(state_broadcaster())
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     try:
         while True:
-            # Use thread pool to avoid blocking event loop with file I/O
-            state = await asyncio.to_thread(read_state_file)
-            await websocket.send_json(state)
-            await asyncio.sleep(1)
+            # Clients never send data; this parks until the socket
+            # closes so the broadcaster owns all outbound traffic
+            await websocket.receive_text()
     except WebSocketDisconnect:
         manager.disconnect(websocket)
     except Exception as e:
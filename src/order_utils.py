@@ -1,7 +1,9 @@
 """
 Order Utilities - Reliable order placement with confirmation
 """
-from ib_insync import IB, Stock, LimitOrder, MarketOrder
+import asyncio
+
+from ib_insync import IB, Stock, LimitOrder, MarketOrder, util
 import logging
 from typing import Optional, Tuple
 from datetime import datetime
@@ -30,6 +32,23 @@ class OrderConfirmation:
         quantity: int,
         price: Optional[float] = None,  # None for market order
         timeout: int = 60
+    ) -> Tuple[bool, str, dict]:
+        """Blocking wrapper around place_and_confirm_async.
+
+        Only safe outside a running event loop (e.g. standalone
+        scripts); code running as a task on ib_insync's loop must await
+        place_and_confirm_async directly.
+        """
+        return util.run(self.place_and_confirm_async(
+            symbol, action, quantity, price, timeout))
+
+    async def place_and_confirm_async(
+        self,
+        symbol: str,
+        action: str,  # 'BUY' or 'SELL'
+        quantity: int,
+        price: Optional[float] = None,  # None for market order
+        timeout: int = 60
     ) -> Tuple[bool, str, dict]:
         """
         Place order and confirm execution.
@@ -43,7 +62,7 @@ class OrderConfirmation:
 
         # Create contract
         contract = Stock(symbol, 'SMART', 'USD')
-        self.ib.qualifyContracts(contract)
+        await self.ib.qualifyContractsAsync(contract)
 
         # Create order
         if price:
@@ -63,7 +82,7 @@ class OrderConfirmation:
         status = "Unknown"
 
         for i in range(timeout):
-            self.ib.sleep(1)
+            await asyncio.sleep(1)
             status = trade.orderStatus.status
 
             if status == 'Filled':
@@ -79,7 +98,7 @@ class OrderConfirmation:
                     logger.info(f"Waiting... Status: {status}")
 
         # CONFIRMATION CHECK: Verify position changed
-        self.ib.sleep(2)  # Wait for position update
+        await asyncio.sleep(2)  # Wait for position update
         position_after = self.get_position(symbol)
         logger.info(f"Position after: {position_after} shares")
 
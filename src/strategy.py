@@ -12,6 +12,7 @@ Optimized parameters from backtesting:
 - 5-day minimum hold period
 """
 import logging
+from collections import deque
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -111,10 +112,50 @@ class SimpleStrategy:
         self.periods_held = 0
         self.in_position = False
 
+        # Rolling-sum MA state, maintained incrementally by add_price so
+        # reading an MA is O(1) instead of a slice+sum per call
+        self._short_win = deque(maxlen=short_window)
+        self._long_win = deque(maxlen=long_window)
+        self._short_sum = 0.0
+        self._long_sum = 0.0
+
+        # Incremental RSI state: rolling (gain, loss) window and sums
+        # over the last rsi_period price changes, maintained by
+        # add_price so reading RSI is O(1) per tick
+        self._rsi_win = deque(maxlen=rsi_period)
+        self._rsi_gain_sum = 0.0
+        self._rsi_loss_sum = 0.0
+        self._rsi_prev_price = None
+
     def add_price(self, price):
         """Add a new price to the history"""
         self.prices.append(price)
 
+        # Update the rolling MA sums (drop the price leaving each window)
+        if len(self._short_win) == self.short_window:
+            self._short_sum -= self._short_win[0]
+        self._short_win.append(price)
+        self._short_sum += price
+
+        if len(self._long_win) == self.long_window:
+            self._long_sum -= self._long_win[0]
+        self._long_win.append(price)
+        self._long_sum += price
+
+        # Update the rolling RSI gain/loss sums from this price change
+        if self._rsi_prev_price is not None:
+            change = price - self._rsi_prev_price
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            if len(self._rsi_win) == self.rsi_period:
+                old_gain, old_loss = self._rsi_win[0]
+                self._rsi_gain_sum -= old_gain
+                self._rsi_loss_sum -= old_loss
+            self._rsi_win.append((gain, loss))
+            self._rsi_gain_sum += gain
+            self._rsi_loss_sum += loss
+        self._rsi_prev_price = price
+
         # Track peak price since entry
         if self.in_position and price > self.peak_price:
             self.peak_price = price
@@ -134,6 +175,18 @@ class SimpleStrategy:
         """Add a new volume to the history"""
         self.volumes.append(volume)
 
+    def get_short_ma(self) -> float:
+        """Current short-window MA from the rolling sum (0 until window full)"""
+        if len(self._short_win) < self.short_window:
+            return 0
+        return self._short_sum / self.short_window
+
+    def get_long_ma(self) -> float:
+        """Current long-window MA from the rolling sum (0 until window full)"""
+        if len(self._long_win) < self.long_window:
+            return 0
+        return self._long_sum / self.long_window
+
     def get_volume_ma(self) -> float:
         """Calculate average volume over the volume_ma_period"""
         if len(self.volumes) < self.volume_ma_period:
@@ -272,11 +325,15 @@ class SimpleStrategy:
 
     def get_current_rsi(self) -> float:
         """Calculate current RSI"""
-        if len(self.prices) < self.rsi_period + 1:
+        if len(self._rsi_win) < self.rsi_period:
             return 50  # Neutral default
 
-        rsi_values = calculate_rsi(self.prices, self.rsi_period)
-        return rsi_values[-1] if rsi_values and rsi_values[-1] is not None else 50
+        # Read straight off the rolling gain/loss sums maintained by
+        # add_price - O(1) instead of re-diffing the tail window
+        if self._rsi_loss_sum == 0:
+            return 100
+        rs = self._rsi_gain_sum / self._rsi_loss_sum
+        return 100 - (100 / (1 + rs))
 
     def check_stop_loss(self, current_price: float) -> bool:
         """Check if stop-loss is triggered"""
@@ -331,7 +388,7 @@ class SimpleStrategy:
         """
         # Not enough data yet
         if len(self.prices) < self.long_window:
-            logger.info(f"Collecting data: {len(self.prices)}/{self.long_window}")
+            logger.info("Collecting data: %d/%d", len(self.prices), self.long_window)
             return 'HOLD'
 
         current_price = self.prices[-1]
@@ -349,9 +406,9 @@ class SimpleStrategy:
                     logger.info(f"TRAILING STOP triggered: ${current_price:.2f} (peak: ${self.peak_price:.2f})")
                     return 'TRAILING_STOP'
 
-        # Calculate moving averages
-        short_ma = sum(self.prices[-self.short_window:]) / self.short_window
-        long_ma = sum(self.prices[-self.long_window:]) / self.long_window
+        # Moving averages from the O(1) rolling sums
+        short_ma = self.get_short_ma()
+        long_ma = self.get_long_ma()
         rsi = self.get_current_rsi()
         rel_volume = self.get_relative_volume()
 
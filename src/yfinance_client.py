@@ -4,7 +4,9 @@ import time
 from datetime import datetime, timedelta
 from threading import Lock
 
+import requests
 import yfinance as yf
+from requests.adapters import HTTPAdapter
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 logger = logging.getLogger(__name__)
@@ -27,6 +29,12 @@ class YFinanceClient:
     _cache = {}
     _cache_lock = Lock()
 
+    # Shared HTTP session with a pooled adapter so concurrent fetches
+    # reuse TCP+TLS connections instead of handshaking per request
+    _session = requests.Session()
+    _session.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+    _session.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
     # Rate limiting
     _last_request_time = 0
     _rate_limit_lock = Lock()
@@ -100,7 +108,7 @@ class YFinanceClient:
             return []  # Rate limited, return empty
 
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self._session)
             df = ticker.history(period=period, interval=interval)
 
             if df.empty:
@@ -140,7 +148,7 @@ class YFinanceClient:
             return None  # Rate limited
 
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self._session)
             info = ticker.info
 
             result = {
@@ -164,6 +172,65 @@ class YFinanceClient:
                 logger.error(f"YFinance quote error: {e}")
             return None
 
+    def get_quotes(self, symbols: list) -> dict:
+        """Get current quotes for many symbols in a single batched request.
+
+        One yf.download call replaces N serial get_quote round trips.
+        Results are cached under the same per-symbol keys as get_quote.
+
+        Returns:
+            Dict mapping symbol -> quote dict (same shape as get_quote,
+            minus market_cap/name which the batch endpoint doesn't carry)
+        """
+        quotes = {}
+        missing = []
+        for symbol in symbols:
+            cached = self._get_cache(f"quote:{symbol}")
+            if cached is not None:
+                quotes[symbol] = cached
+            else:
+                missing.append(symbol)
+
+        if not missing:
+            return quotes
+
+        if not self._throttle():
+            return quotes  # Rate limited - serve whatever was cached
+
+        try:
+            df = yf.download(missing, period='2d', interval='1d',
+                             group_by='ticker', progress=False, threads=False,
+                             session=self._session)
+            for symbol in missing:
+                try:
+                    sym_df = df[symbol] if len(missing) > 1 else df
+                    sym_df = sym_df.dropna(subset=['Close'])
+                    if sym_df.empty:
+                        continue
+                    last = sym_df.iloc[-1]
+                    prev_close = float(sym_df['Close'].iloc[-2]) if len(sym_df) > 1 else 0
+                    result = {
+                        'symbol': symbol,
+                        'price': float(last['Close']),
+                        'open': float(last['Open']),
+                        'high': float(last['High']),
+                        'low': float(last['Low']),
+                        'volume': int(last['Volume']),
+                        'previous_close': prev_close,
+                        'timestamp': datetime.now()
+                    }
+                    self._set_cache(f"quote:{symbol}", result, self.CACHE_TTL_QUOTE)
+                    quotes[symbol] = result
+                except (KeyError, IndexError, ValueError):
+                    logger.warning(f"No batch quote data for {symbol}")
+            return quotes
+        except Exception as e:
+            if 'RateLimit' in str(type(e).__name__) or 'rate' in str(e).lower():
+                self._handle_rate_limit()
+            else:
+                logger.error(f"YFinance batch quote error: {e}")
+            return quotes
+
     def get_info(self, symbol: str) -> dict:
         """Get company info with caching"""
         cache_key = f"info:{symbol}"
@@ -175,7 +242,7 @@ class YFinanceClient:
             return {}  # Rate limited
 
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self._session)
             info = ticker.info
             self._set_cache(cache_key, info, self.CACHE_TTL_INFO)
             return info
@@ -197,7 +264,7 @@ class YFinanceClient:
             return {}  # Rate limited
 
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self._session)
             events = {}
 
             # Get earnings date - handle both old and new yfinance formats
@@ -265,7 +332,7 @@ class YFinanceClient:
             return []  # Rate limited
 
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self._session)
             news = ticker.news
 
             if not news:
@@ -349,7 +416,7 @@ class YFinanceClient:
             return {}  # Rate limited
 
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self._session)
 
             # Try to get recommendations summary
             # yfinance provides: strongBuy, buy, hold, sell, strongSell
@@ -408,7 +475,7 @@ class YFinanceClient:
             return []  # Rate limited
 
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self._session)
             upgrades = ticker.upgrades_downgrades
 
             if upgrades is None or len(upgrades) == 0:
@@ -377,13 +377,19 @@ def get_symbols_by_category(category_name):
         return STOCK_CATEGORIES[category_name]["symbols"]
     return []
 
+# Inverse index built once - symbol -> category lookups are O(1) instead
+# of scanning every category's symbol list
+_SYMBOL_CATEGORY_INDEX = {}
+for _cat_name, _cat_data in STOCK_CATEGORIES.items():
+    for _symbol in _cat_data["symbols"]:
+        # setdefault keeps the first category when a symbol appears twice,
+        # matching the old scan order
+        _SYMBOL_CATEGORY_INDEX.setdefault(_symbol, _cat_name)
+
 # Get category for a symbol
 def get_symbol_category(symbol):
     """Get category name for a symbol"""
-    for cat_name, cat_data in STOCK_CATEGORIES.items():
-        if symbol in cat_data["symbols"]:
-            return cat_name
-    return "UNCATEGORIZED"
+    return _SYMBOL_CATEGORY_INDEX.get(symbol, "UNCATEGORIZED")
 
 # Default position sizes by category
 CATEGORY_POSITION_SIZES = {